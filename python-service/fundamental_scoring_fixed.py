@@ -7,51 +7,52 @@ Solution: Different thresholds for different sectors
 from typing import Dict, List
 
 
+# Ticker -> sector, same mapping as stock_screener.py (module-level so it isn't rebuilt per call)
+TICKER_TO_SECTOR = {
+    # Banking & Financial Services
+    "HDFCBANK.NS": "Banking", "ICICIBANK.NS": "Banking", "SBIN.NS": "Banking",
+    "KOTAKBANK.NS": "Banking", "AXISBANK.NS": "Banking", "INDUSINDBK.NS": "Banking",
+    "BAJFINANCE.NS": "Banking", "BAJAJFINSV.NS": "Banking",
+    "SBILIFE.NS": "Banking", "HDFCLIFE.NS": "Banking",
+
+    # IT
+    "TCS.NS": "IT", "INFY.NS": "IT", "HCLTECH.NS": "IT",
+    "WIPRO.NS": "IT", "TECHM.NS": "IT", "LTIM.NS": "IT",
+
+    # Automobiles
+    "MARUTI.NS": "Automobile", "TATAMOTORS.NS": "Automobile",
+    "M&M.NS": "Automobile", "EICHERMOT.NS": "Automobile",
+    "HEROMOTOCO.NS": "Automobile", "BAJAJ-AUTO.NS": "Automobile",
+
+    # Pharma
+    "SUNPHARMA.NS": "Pharma", "DRREDDY.NS": "Pharma",
+    "CIPLA.NS": "Pharma", "DIVISLAB.NS": "Pharma", "APOLLOHOSP.NS": "Pharma",
+
+    # FMCG
+    "HINDUNILVR.NS": "FMCG", "ITC.NS": "FMCG", "NESTLEIND.NS": "FMCG",
+    "BRITANNIA.NS": "FMCG", "TATACONSUM.NS": "FMCG",
+    "TITAN.NS": "FMCG", "ASIANPAINT.NS": "FMCG",
+
+    # Metals
+    "TATASTEEL.NS": "Metals", "JSWSTEEL.NS": "Metals",
+    "HINDALCO.NS": "Metals", "COALINDIA.NS": "Metals",
+
+    # Energy / Oil & Gas
+    "RELIANCE.NS": "Energy", "ONGC.NS": "Energy", "BPCL.NS": "Energy",
+    "POWERGRID.NS": "Energy", "NTPC.NS": "Energy",
+
+    # Construction
+    "ULTRACEMCO.NS": "Construction", "GRASIM.NS": "Construction",
+    "LT.NS": "Construction", "ADANIPORTS.NS": "Construction",
+    "BHARTIARTL.NS": "Construction",
+    "UPL.NS": "Construction",
+    "ADANIENT.NS": "Construction"
+}
+
+
 def get_stock_sector_from_ticker(ticker: str) -> str:
     """Determine stock sector from ticker using mapping"""
-    # Use same mapping as stock_screener.py
-    ticker_to_sector = {
-        # Banking & Financial Services
-        "HDFCBANK.NS": "Banking", "ICICIBANK.NS": "Banking", "SBIN.NS": "Banking",
-        "KOTAKBANK.NS": "Banking", "AXISBANK.NS": "Banking", "INDUSINDBK.NS": "Banking",
-        "BAJFINANCE.NS": "Banking", "BAJAJFINSV.NS": "Banking",
-        "SBILIFE.NS": "Banking", "HDFCLIFE.NS": "Banking",
-
-        # IT
-        "TCS.NS": "IT", "INFY.NS": "IT", "HCLTECH.NS": "IT",
-        "WIPRO.NS": "IT", "TECHM.NS": "IT", "LTIM.NS": "IT",
-
-        # Automobiles
-        "MARUTI.NS": "Automobile", "TATAMOTORS.NS": "Automobile",
-        "M&M.NS": "Automobile", "EICHERMOT.NS": "Automobile",
-        "HEROMOTOCO.NS": "Automobile", "BAJAJ-AUTO.NS": "Automobile",
-
-        # Pharma
-        "SUNPHARMA.NS": "Pharma", "DRREDDY.NS": "Pharma",
-        "CIPLA.NS": "Pharma", "DIVISLAB.NS": "Pharma", "APOLLOHOSP.NS": "Pharma",
-
-        # FMCG
-        "HINDUNILVR.NS": "FMCG", "ITC.NS": "FMCG", "NESTLEIND.NS": "FMCG",
-        "BRITANNIA.NS": "FMCG", "TATACONSUM.NS": "FMCG",
-        "TITAN.NS": "FMCG", "ASIANPAINT.NS": "FMCG",
-
-        # Metals
-        "TATASTEEL.NS": "Metals", "JSWSTEEL.NS": "Metals",
-        "HINDALCO.NS": "Metals", "COALINDIA.NS": "Metals",
-
-        # Energy / Oil & Gas
-        "RELIANCE.NS": "Energy", "ONGC.NS": "Energy", "BPCL.NS": "Energy",
-        "POWERGRID.NS": "Energy", "NTPC.NS": "Energy",
-
-        # Construction
-        "ULTRACEMCO.NS": "Construction", "GRASIM.NS": "Construction",
-        "LT.NS": "Construction", "ADANIPORTS.NS": "Construction",
-        "BHARTIARTL.NS": "Construction",
-        "UPL.NS": "Construction",
-        "ADANIENT.NS": "Construction"
-    }
-
-    return ticker_to_sector.get(ticker, "General")
+    return TICKER_TO_SECTOR.get(ticker, "General")
 
 
 def get_stock_sector(info: Dict) -> str:
@@ -0,0 +1,242 @@
+"""
+Indicator Kernels
+Scalar recurrences behind the trading indicators (EMA, Wilder smoothing, ADX, VWAP),
+JIT-compiled with numba when it is installed
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Tuple
+
+logger = logging.getLogger("protrader")
+
+# numba is in requirements.txt; fall back to pandas' compiled ewm if it is missing
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    logger.warning("numba not installed. Using pandas indicator kernels.")
+
+# fastmath without 'nnan'/'ninf': the kernels rely on explicit NaN checks
+FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _ewm_alpha_loop(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    EMA recurrence with pandas' ewm(adjust=False) semantics:
+    y[0] = x[0]; y[i] = y[i-1] + alpha * (x[i] - y[i-1]), carrying the last value over NaNs
+    """
+    n = len(values)
+    out = np.empty(n)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = values[0]
+    old_wt = 1.0
+    out[0] = weighted
+    for i in range(1, n):
+        cur = values[i]
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if cur == cur:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif cur == cur:
+            weighted = cur
+        out[i] = weighted
+    return out
+
+
+def _wilder_averages_loop(close: np.ndarray, period: int) -> Tuple[float, float]:
+    """Final Wilder-smoothed average gain and loss of bar-to-bar moves, in one loop"""
+    alpha = 1.0 / period
+    old_wt_factor = 1.0 - alpha
+    # The first bar has no previous close, so it counts as no gain and no loss
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, len(close)):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if avg_gain != gain:
+            avg_gain = (old_wt_factor * avg_gain + alpha * gain) / (old_wt_factor + alpha)
+        if avg_loss != loss:
+            avg_loss = (old_wt_factor * avg_loss + alpha * loss) / (old_wt_factor + alpha)
+    return avg_gain, avg_loss
+
+
+def _directional_index_loop(high: np.ndarray, low: np.ndarray, tr: np.ndarray,
+                            period: int) -> Tuple[float, float, float]:
+    """
+    Final +DI, -DI and ADX (mean of the last `period` DX values, each from `period`-bar means
+    of +DM, -DM and the true range) in one pass over the last 2 * period - 1 bars
+    tr is aligned to the end of high/low; a NaN or missing true range in a window makes it NaN
+    """
+    n = len(high)
+    offset = n - len(tr)
+    plus_di = np.nan
+    minus_di = np.nan
+    dx_sum = 0.0
+    for end in range(n - period, n):
+        start = end - period + 1
+        if start < 0 or start < offset:
+            dx_sum = np.nan
+            continue
+        plus_sum = 0.0
+        minus_sum = 0.0
+        tr_sum = 0.0
+        for j in range(start, end + 1):
+            # NaN moves (and the first bar, with no previous bar) count as no directional move
+            if j > 0:
+                up = high[j] - high[j - 1]
+                down = low[j - 1] - low[j]
+                if up > down and up > 0:
+                    plus_sum += up
+                elif down > up and down > 0:
+                    minus_sum += down
+            tr_sum += tr[j - offset]
+        plus_di = 100 * plus_sum / tr_sum
+        minus_di = 100 * minus_sum / tr_sum
+        dx_sum += 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    return plus_di, minus_di, dx_sum / period
+
+
+def _vwap_loop(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               volume: np.ndarray) -> Tuple[float, float]:
+    """
+    Final VWAP and its volume-weighted standard deviation in one pass
+    Each bar's deviation is taken from the running VWAP at that bar; NaN bars are skipped
+    in the cumulative sums but make the result NaN when they are the last bar (pandas cumsum semantics)
+    """
+    cum_tp_volume = 0.0
+    cum_volume = 0.0
+    cum_dev_volume = 0.0
+    vwap = np.nan
+    volume_sum = np.nan
+    dev_volume_sum = np.nan
+    for i in range(len(close)):
+        tp = (high[i] + low[i] + close[i]) / 3
+        tp_volume = tp * volume[i]
+        tp_volume_sum = np.nan
+        volume_sum = np.nan
+        if tp_volume == tp_volume:
+            cum_tp_volume += tp_volume
+            tp_volume_sum = cum_tp_volume
+        if volume[i] == volume[i]:
+            cum_volume += volume[i]
+            volume_sum = cum_volume
+        vwap = tp_volume_sum / volume_sum
+
+        dev_volume = (tp - vwap) ** 2 * volume[i]
+        dev_volume_sum = np.nan
+        if dev_volume == dev_volume:
+            cum_dev_volume += dev_volume
+            dev_volume_sum = cum_dev_volume
+    return vwap, np.sqrt(dev_volume_sum / volume_sum)
+
+
+if HAS_NUMBA:
+    _ewm_alpha_jit = njit(cache=True, fastmath=FASTMATH_FLAGS)(_ewm_alpha_loop)
+    _wilder_averages_jit = njit(cache=True, fastmath=FASTMATH_FLAGS)(_wilder_averages_loop)
+    # error_model='numpy': a flat window divides by zero into NaN/inf instead of raising
+    _directional_index_jit = njit(cache=True, fastmath=FASTMATH_FLAGS, error_model='numpy')(_directional_index_loop)
+    # No fastmath: VWAP positions compare price to bands exactly, and reassociated sums break ties
+    _vwap_jit = njit(cache=True, error_model='numpy')(_vwap_loop)
+
+
+def ewm_alpha(values: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential moving average of a float64 array (adjust=False)"""
+    if HAS_NUMBA:
+        return _ewm_alpha_jit(values, alpha)
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def wilder_averages(close: np.ndarray, period: int) -> Tuple[float, float]:
+    """
+    Last Wilder-smoothed (alpha = 1/period) average gain and average loss of close
+    Callers need at least `period` bars for the result to be meaningful
+    """
+    if HAS_NUMBA:
+        return _wilder_averages_jit(close, period)
+
+    delta = np.diff(close, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    return float(ewm_alpha(gain, 1 / period)[-1]), float(ewm_alpha(loss, 1 / period)[-1])
+
+
+def _trailing_means(values: np.ndarray, window: int, count: int) -> np.ndarray:
+    """Means of the last `count` rolling windows, NaN where there is no full window"""
+    out = np.full(count, np.nan)
+    available = min(count, len(values) - window + 1)
+    if available > 0:
+        out[count - available:] = sliding_window_view(values[-(window + available - 1):], window).mean(axis=1)
+    return out
+
+
+def directional_index(high: np.ndarray, low: np.ndarray, tr: np.ndarray,
+                      period: int = 14) -> Tuple[float, float, float]:
+    """
+    Last +DI, -DI and ADX, with DI smoothed by `period`-bar means over the true range
+    tr only needs its last 2 * period - 1 values, aligned to the end of high/low
+    """
+    if HAS_NUMBA:
+        return _directional_index_jit(high, low, tr, period)
+
+    bars = 2 * period - 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        high_diff = np.diff(high[-(bars + 1):], prepend=np.nan)[-bars:]
+        low_diff = -np.diff(low[-(bars + 1):], prepend=np.nan)[-bars:]
+        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0.0)
+        minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0.0)
+        atr = _trailing_means(tr, period, period)
+        plus_di = 100 * (_trailing_means(plus_dm, period, period) / atr)
+        minus_di = 100 * (_trailing_means(minus_dm, period, period) / atr)
+        dx = 100 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return float(plus_di[-1]), float(minus_di[-1]), float(dx.mean())
+
+
+def _cumsum_skipna(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum that skips NaNs but keeps them NaN in place, like pandas' Series.cumsum"""
+    out = np.nancumsum(values)
+    out[np.isnan(values)] = np.nan
+    return out
+
+
+def vwap_last(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              volume: np.ndarray) -> Tuple[float, float]:
+    """
+    Latest VWAP and VWAP standard deviation of the bars
+    std = sqrt(Cumulative((Typical Price - VWAP)^2 * Volume) / Cumulative(Volume))
+    """
+    if HAS_NUMBA:
+        return _vwap_jit(high, low, close, volume)
+
+    typical_price = (high + low + close) / 3
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # The running VWAP is needed for every bar's deviation, but only the final cumulative deviation
+        cumulative_volume = _cumsum_skipna(volume)
+        vwap = _cumsum_skipna(typical_price * volume) / cumulative_volume
+        dev_volume = (typical_price - vwap) ** 2 * volume
+        cumulative_dev_volume = np.nansum(dev_volume) if not np.isnan(dev_volume[-1]) else np.nan
+        vwap_std = np.sqrt(cumulative_dev_volume / cumulative_volume[-1])
+    return float(vwap[-1]), float(vwap_std)
+
+
+def warm_up_kernels():
+    """
+    Compile the jitted kernels (or load them from numba's on-disk cache) ahead of the first request
+    No-op without numba
+    """
+    if not HAS_NUMBA:
+        return
+    sample = np.linspace(100.0, 101.0, 32)
+    ewm_alpha(sample, 0.5)
+    wilder_averages(sample, 14)
+    directional_index(sample + 1.0, sample - 1.0, np.full(27, 2.0), 14)
+    vwap_last(sample + 1.0, sample - 1.0, sample, np.full(32, 1000.0))
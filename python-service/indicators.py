@@ -2,14 +2,18 @@
 Technical Indicators using TA-Lib
 """
 
+import logging
 import pandas as pd
 import numpy as np
+
+logger = logging.getLogger("protrader")
+
 try:
     import talib
     TALIB_AVAILABLE = True
 except ImportError:
     TALIB_AVAILABLE = False
-    print("Warning: TA-Lib not available. Using fallback calculations.")
+    logger.warning("TA-Lib not available. Using fallback calculations.")
 
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> float:
     """Calculate RSI"""
@@ -53,8 +57,12 @@ def calculate_sma(df: pd.DataFrame, period: int) -> float:
         sma = talib.SMA(df['Close'], timeperiod=period)
         return float(sma.iloc[-1]) if not pd.isna(sma.iloc[-1]) else None
     else:
-        sma = df['Close'].rolling(window=period).mean()
-        return float(sma.iloc[-1]) if not pd.isna(sma.iloc[-1]) else None
+        # Only the latest average is reported, so take the mean of the last window alone
+        window = df['Close'].to_numpy(dtype=np.float64)[-period:]
+        if len(window) < period:
+            return None
+        sma = window.mean()
+        return float(sma) if not np.isnan(sma) else None
 
 def calculate_ema(df: pd.DataFrame, period: int) -> float:
     """Calculate Exponential Moving Average"""
@@ -75,14 +83,19 @@ def calculate_bollinger_bands(df: pd.DataFrame, period: int = 20, std_dev: int =
             "lower": float(lower.iloc[-1]) if not pd.isna(lower.iloc[-1]) else None
         }
     else:
-        middle = df['Close'].rolling(window=period).mean()
-        std = df['Close'].rolling(window=period).std()
+        # Only the latest band is reported, so take mean and std of the last window alone;
+        # numpy's two-pass std cannot drift negative the way running variance updates can
+        window = df['Close'].to_numpy(dtype=np.float64)[-period:]
+        if len(window) < period:
+            return {"upper": None, "middle": None, "lower": None}
+        middle = window.mean()
+        std = window.std(ddof=1)
         upper = middle + (std * std_dev)
         lower = middle - (std * std_dev)
         return {
-            "upper": float(upper.iloc[-1]) if not pd.isna(upper.iloc[-1]) else None,
-            "middle": float(middle.iloc[-1]) if not pd.isna(middle.iloc[-1]) else None,
-            "lower": float(lower.iloc[-1]) if not pd.isna(lower.iloc[-1]) else None
+            "upper": float(upper) if not np.isnan(upper) else None,
+            "middle": float(middle) if not np.isnan(middle) else None,
+            "lower": float(lower) if not np.isnan(lower) else None
         }
 
 def calculate_stochastic(df: pd.DataFrame, period: int = 14):
@@ -6,11 +6,37 @@ NOW WITH: 10-year backtest auto-integrated with signals
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 from typing import List, Optional, Dict, Any
+import asyncio
+from contextlib import asynccontextmanager
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import yfinance as yf
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+import functools
+import httpx
+
+# Logging: request handlers only enqueue records; a listener thread does the stream I/O.
+# Set up before the service modules below are imported, since they log to "protrader" at import time
+logger = logging.getLogger("protrader")
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+log_listener.start()
+
 from data_sources import data_source
 from indicators import (
     calculate_rsi,
@@ -19,23 +45,80 @@ from indicators import (
     calculate_sma,
     calculate_all_indicators
 )
-from sentiment import analyze_sentiment_vader, analyze_news_sentiment, get_real_sentiment_score, categorize_sentiment
-from news_aggregator import fetch_top_market_news
+from sentiment import analyze_sentiment_vader, get_real_sentiment_score, categorize_sentiment, categorize_news_sentiment
+from news_aggregator import fetch_top_market_news_async
 from trading_signals import analyze_trading_signals
+from indicator_kernels import warm_up_kernels
 from enhanced_signals import enhance_trading_signals
 from backtesting import run_full_backtest
+from response_cache import get_cached, set_cached, clear_response_cache
 
 # Import enhanced backtesting
 from backtesting_enhanced import run_production_backtest, BacktestConfig
 
+
+@functools.lru_cache(maxsize=1)
+def _default_backtest_window(day_token: int):
+    """(end_date, start_date) for the 10-year backtest window; recomputed once per day"""
+    today = datetime.now()
+    return today.strftime("%Y-%m-%d"), (today - timedelta(days=10*365)).strftime("%Y-%m-%d")
+
+
+def default_backtest_window():
+    return _default_backtest_window(date.today().toordinal())
+
+
+# Backtests are CPU-bound; worker processes let concurrent requests use separate cores.
+# Capped so a few backtests can't take every core from the uvicorn workers
+BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", min(4, os.cpu_count() or 1)))
+backtest_pool: Optional[ProcessPoolExecutor] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global backtest_pool
+    # spawn, not fork: the log listener and HTTP client threads are already running, and a forked
+    # child can inherit one of their locks held and deadlock
+    backtest_pool = ProcessPoolExecutor(
+        max_workers=BACKTEST_WORKERS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+    # Exercise the shared VADER analyzer once so the first request skips lazy setup
+    analyze_sentiment_vader("Markets open higher")
+
+    # Likewise for the numba indicator kernels, which otherwise compile on first use
+    warm_up_kernels()
+
+    # One pooled HTTP/2 client for outbound news fetches (keep-alive, multiplexed topics)
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    )
+
+    yield
+
+    await app.state.http.aclose()
+    backtest_pool.shutdown(wait=False, cancel_futures=True)
+    log_listener.stop()
+
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes numpy arrays and scalars"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
 app = FastAPI(
     title="ProTrader AI Python Service",
     description="Advanced quantitative analysis for ProTrader AI",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=NumpyORJSONResponse,
+    lifespan=lifespan
 )
 
-import os
-
 # CORS middleware
 allowed_origins = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
 
@@ -47,6 +130,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (chart candles, full backtests) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 class IndicatorRequest(BaseModel):
     ticker: str
     period: str = "1y"
@@ -153,26 +239,12 @@ async def analyze_news_sentiment_endpoint(request: NewsSentimentRequest):
         avg_sentiment = sum(s["compound"] for s in sentiments) / len(sentiments)
 
         # Categorize
-        if avg_sentiment > 0.3:
-            label = "Very Bullish"
-            color = "green"
-        elif avg_sentiment > 0.1:
-            label = "Bullish"
-            color = "lightgreen"
-        elif avg_sentiment < -0.3:
-            label = "Very Bearish"
-            color = "red"
-        elif avg_sentiment < -0.1:
-            label = "Bearish"
-            color = "orange"
-        else:
-            label = "Neutral"
-            color = "gray"
+        category = categorize_news_sentiment(avg_sentiment)
 
         return {
             "average_sentiment": avg_sentiment,
-            "label": label,
-            "color": color,
+            "label": category["label"],
+            "color": category["color"],
             "article_count": len(sentiments),
             "sentiments": sentiments
         }
@@ -199,7 +271,7 @@ async def get_general_market_news():
     """
     try:
         # Fetch top market news
-        news_items = fetch_top_market_news(limit=20)
+        news_items = await fetch_top_market_news_async(app.state.http, limit=20)
 
         # Analyze sentiment for each
         analyzed_news = []
@@ -248,32 +320,54 @@ async def get_stock_quote(ticker: str):
     """
     try:
         stock = yf.Ticker(ticker)
-        info = stock.info
 
-        # Get the most recent data
-        hist = stock.history(period="1d")
-        if hist.empty:
-            raise HTTPException(status_code=404, detail="No data found for ticker")
+        # Latest session from fast_info; only hit history() if it is unavailable.
+        # Every field comes from these price requests, so there is no stock.info round trip
+        try:
+            fi = stock.fast_info
+            current_price = fi.last_price
+            day_open, day_high, day_low, day_volume = fi.open, fi.day_high, fi.day_low, fi.last_volume
+            # last_price can come from exchange metadata while the session prices are missing
+            # (empty 1-year price frame); fall back to history for all of them
+            if current_price is None or day_open is None or day_high is None or day_low is None:
+                raise KeyError('fast_info session prices')
+            previous_close = fi.previous_close or current_price
+            market_cap = fi.market_cap or 0
+            fifty_day_avg = fi.fifty_day_average or 0
+            two_hundred_day_avg = fi.two_hundred_day_average or 0
+        except (AttributeError, KeyError):
+            hist = stock.history(period="2d")
+            if hist.empty:
+                raise HTTPException(status_code=404, detail="No data found for ticker")
+
+            current_price = hist['Close'].iloc[-1]
+            previous_close = hist['Close'].iloc[-2] if len(hist) > 1 else current_price
+            day_open, day_high, day_low, day_volume = (
+                hist['Open'].iloc[-1], hist['High'].iloc[-1], hist['Low'].iloc[-1], hist['Volume'].iloc[-1]
+            )
+            market_cap = fifty_day_avg = two_hundred_day_avg = 0
+
+        # The chart metadata of the price request above carries the display name
+        metadata = stock.get_history_metadata()
+        name = metadata.get('longName') or metadata.get('shortName') or ticker
 
-        current_price = hist['Close'].iloc[-1]
-        previous_close = info.get('previousClose', current_price)
         change = current_price - previous_close
         change_percent = (change / previous_close * 100) if previous_close else 0
 
         return {
             "symbol": ticker,
-            "name": info.get('longName') or info.get('shortName') or ticker,
+            "name": name,
             "price": float(current_price),
             "change": float(change),
             "changePercent": float(change_percent),
-            "open": float(info.get('open', hist['Open'].iloc[-1])),
-            "high": float(info.get('dayHigh', hist['High'].iloc[-1])),
-            "low": float(info.get('dayLow', hist['Low'].iloc[-1])),
-            "volume": int(info.get('volume', hist['Volume'].iloc[-1])),
+            "open": float(day_open),
+            "high": float(day_high),
+            "low": float(day_low),
+            "volume": int(day_volume or 0),
             "previousClose": float(previous_close),
-            "marketCap": info.get('marketCap', 0),
-            "fiftyDayAvg": info.get('fiftyDayAverage', 0),
-            "twoHundredDayAvg": info.get('twoHundredDayAverage', 0)
+            "marketCap": market_cap,
+            "fiftyDayAvg": fifty_day_avg,
+            "twoHundredDayAvg": two_hundred_day_avg
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching quote: {str(e)}")
@@ -348,13 +442,21 @@ async def get_trading_signals(ticker: str, enhanced: bool = True):
         * Trading recommendations
     """
     try:
+        cache_key = (ticker.upper(), enhanced)
+        cached = get_cached("signals", cache_key)
+        if cached is not None:
+            return cached
+
         # Get raw signals
-        result = analyze_trading_signals(ticker)
+        result = await asyncio.to_thread(analyze_trading_signals, ticker)
 
         # Enhance with production-ready features
         if enhanced and 'error' not in result:
             result = enhance_trading_signals(result)
 
+        if 'error' not in result:
+            set_cached("signals", cache_key, result)
+
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing signals: {str(e)}")
@@ -373,26 +475,23 @@ async def get_signals_with_backtest(ticker: str):
     - Recommended position size based on backtest
     """
     try:
-        print(f"Analyzing {ticker} with 10-year backtest validation...")
+        logger.info("Analyzing %s with 10-year backtest validation", ticker)
 
         # 1. Get current signals
-        signals = analyze_trading_signals(ticker)
-        if 'error' in signals:
-            raise HTTPException(status_code=500, detail=signals['error'])
+        signals = get_cached("signals", (ticker.upper(), True))
+        if signals is None:
+            signals = await asyncio.to_thread(analyze_trading_signals, ticker)
+            if 'error' in signals:
+                raise HTTPException(status_code=500, detail=signals['error'])
 
-        signals = enhance_trading_signals(signals)
+            signals = enhance_trading_signals(signals)
+            set_cached("signals", (ticker.upper(), True), signals)
 
         # 2. Run 10-year backtest (2015-2025)
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=10*365)).strftime("%Y-%m-%d")
+        end_date, start_date = default_backtest_window()
 
-        print(f"Running backtest from {start_date} to {end_date}...")
-        backtest = run_production_backtest(
-            ticker=ticker,
-            start_date=start_date,
-            end_date=end_date,
-            initial_capital=100000
-        )
+        logger.debug("Running backtest %s..%s", start_date, end_date)
+        backtest = await get_cached_backtest(ticker, start_date, end_date, 100000)
 
         # 3. Determine best strategy and recommendations
         best_strategy = determine_best_strategy(backtest, signals)
@@ -441,12 +540,27 @@ async def get_signals_with_backtest(ticker: str):
         }
 
     except Exception as e:
-        import traceback
-        print(f"Error in signals_with_backtest: {str(e)}")
-        print(traceback.format_exc())
+        logger.exception("Error in signals_with_backtest for %s", ticker)
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+async def get_cached_backtest(ticker: str, start_date: str, end_date: str, initial_capital: float) -> Dict[str, Any]:
+    """
+    Run the production backtest in the process pool, reusing a cached result for the same window
+    """
+    cache_key = (ticker.upper(), start_date, end_date, initial_capital)
+    cached = get_cached("backtest", cache_key)
+    if cached is not None:
+        return cached
+
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(
+        backtest_pool, run_production_backtest, ticker, start_date, end_date, initial_capital
+    )
+    set_cached("backtest", cache_key, result)
+    return result
+
+
 def determine_best_strategy(backtest: Dict[str, Any], signals: Dict[str, Any]) -> Dict[str, Any]:
     """
     Analyze backtest results and current signals to recommend best strategy
@@ -565,12 +679,13 @@ async def get_enhanced_backtest(
     """
     try:
         # Default to 10 years if not specified
+        default_end, default_start = default_backtest_window()
         if not end_date:
-            end_date = datetime.now().strftime("%Y-%m-%d")
+            end_date = default_end
         if not start_date:
-            start_date = (datetime.now() - timedelta(days=10*365)).strftime("%Y-%m-%d")
+            start_date = default_start
 
-        result = run_production_backtest(ticker, start_date, end_date, initial_capital)
+        result = await get_cached_backtest(ticker, start_date, end_date, initial_capital)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -589,6 +704,7 @@ async def backtest_strategy(ticker: str, start_date: str, end_date: str, initial
 
 # Stock Screener Endpoints
 from stock_screener import (
+    iter_screen_nifty50,
     screen_nifty50,
     get_stock_comparison,
     clear_cache
@@ -615,6 +731,24 @@ async def screen_nifty_50(force_refresh: bool = False):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error screening stocks: {str(e)}")
 
+@app.get("/screener/nifty50/stream")
+async def stream_nifty_50(force_refresh: bool = False):
+    """
+    Stream Nifty 50 screening results as newline-delimited JSON
+
+    Each line is {"ticker", "from_cache", "signals"} and is sent as soon as that
+    stock is ready, so the first rows arrive without waiting for the full screen.
+    Use /screener/nifty50 for the categorized summary.
+    """
+    def lines():
+        for ticker, signals, from_cache in iter_screen_nifty50(force_refresh=force_refresh):
+            yield orjson.dumps(
+                {"ticker": ticker, "from_cache": from_cache, "signals": signals},
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            )
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @app.post("/screener/compare")
 async def compare_stocks(tickers: List[str]):
     """
@@ -637,6 +771,17 @@ async def clear_screener_cache():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error clearing cache: {str(e)}")
 
+@app.post("/cache/clear-signals")
+async def clear_signals_cache():
+    """
+    Clear cached signal and backtest responses
+    """
+    try:
+        result = clear_response_cache()
+        return result
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error clearing cache: {str(e)}")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
@@ -3,54 +3,76 @@ News Aggregator
 Combines Google News RSS (Free, Real-time) with Yahoo Finance (Fallback)
 """
 
+import asyncio
 import requests
+import time
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 import yfinance as yf
 from typing import List, Dict
 
+GOOGLE_NEWS_RSS_URL = "https://news.google.com/rss/search"
+
+def _google_news_params(ticker: str) -> Dict[str, str]:
+    """Google News RSS query for a ticker or free-text topic"""
+    # specific query format for better results
+    # Clean ticker for Google search
+    clean_ticker = ticker.replace('.NS', '').replace('.BO', '')
+    return {"q": f"{clean_ticker} stock news", "hl": "en-IN", "gl": "IN", "ceid": "IN:en"}
+
+def _parse_google_news_rss(content: bytes, limit: int) -> List[Dict]:
+    """Parse a Google News RSS payload into news items"""
+    root = ET.fromstring(content)
+    news_items = []
+
+    for item in root.findall('.//item')[:limit]:
+        title = item.find('title').text if item.find('title') is not None else ''
+        link = item.find('link').text if item.find('link') is not None else ''
+        pub_date_str = item.find('pubDate').text if item.find('pubDate') is not None else ''
+
+        # RFC-822 pubDate (any TZ spec) or current time fallback
+        try:
+            # E.g., Mon, 08 Dec 2025 10:00:00 GMT / +0530
+            timestamp = int(parsedate_to_datetime(pub_date_str).timestamp()) if pub_date_str else int(time.time())
+        except (TypeError, ValueError):
+            timestamp = int(time.time())
+
+        source = item.find('source').text if item.find('source') is not None else 'Google News'
+
+        news_items.append({
+            "title": title,
+            "link": link,
+            "publisher": source,
+            "providerPublishTime": timestamp,
+            "type": "RSS"
+        })
+
+    return news_items
+
 def fetch_google_news_rss(ticker: str, limit: int = 10) -> List[Dict]:
     """Fetch news from Google News RSS"""
     try:
-        # specific query format for better results
-        # Clean ticker for Google search
-        clean_ticker = ticker.replace('.NS', '').replace('.BO', '')
-        query = f"{clean_ticker} stock news"
-        url = f"https://news.google.com/rss/search?q={query}&hl=en-IN&gl=IN&ceid=IN:en"
-        
-        response = requests.get(url, timeout=10)
+        response = requests.get(GOOGLE_NEWS_RSS_URL, params=_google_news_params(ticker), timeout=10)
         # response.raise_for_status() # Don't raise, just fallback
-        
+
         if response.status_code != 200:
             return []
-            
-        root = ET.fromstring(response.content)
-        news_items = []
-        
-        for item in root.findall('.//item')[:limit]:
-            title = item.find('title').text if item.find('title') is not None else ''
-            link = item.find('link').text if item.find('link') is not None else ''
-            pub_date_str = item.find('pubDate').text if item.find('pubDate') is not None else ''
-            
-            # Simple timestamp parsing or current time fallback
-            try:
-                # E.g., Mon, 08 Dec 2025 10:00:00 GMT
-                dt = datetime.strptime(pub_date_str, '%a, %d %b %Y %H:%M:%S %Z')
-                timestamp = int(dt.timestamp())
-            except Exception:
-                timestamp = int(datetime.now().timestamp())
-
-            source = item.find('source').text if item.find('source') is not None else 'Google News'
-            
-            news_items.append({
-                "title": title,
-                "link": link,
-                "publisher": source,
-                "providerPublishTime": timestamp,
-                "type": "RSS"
-            })
-            
-        return news_items
+
+        return _parse_google_news_rss(response.content, limit)
+    except Exception as e:
+        print(f"Google News RSS Error: {e}")
+        return []
+
+async def fetch_google_news_rss_async(client, ticker: str, limit: int = 10) -> List[Dict]:
+    """Fetch news from Google News RSS using a shared httpx.AsyncClient"""
+    try:
+        response = await client.get(GOOGLE_NEWS_RSS_URL, params=_google_news_params(ticker))
+
+        if response.status_code != 200:
+            return []
+
+        return _parse_google_news_rss(response.content, limit)
     except Exception as e:
         print(f"Google News RSS Error: {e}")
         return []
@@ -95,6 +117,29 @@ def get_aggregated_news(ticker: str, limit: int = 10) -> List[Dict]:
             
     return unique_news[:limit]
 
+MARKET_NEWS_TOPICS = [
+    "Nifty 50 stock market news",
+    "Sensex live news",
+    "Indian economy news",
+    "Global stock market news India impact"
+]
+
+def _merge_market_news(all_news: List[Dict], limit: int) -> List[Dict]:
+    """Sort newest first and deduplicate by title"""
+    # Deduplicate and sort by time
+    seen_titles = set()
+    unique_news = []
+
+    # Sort by time descending (newest first)
+    all_news.sort(key=lambda x: x.get('providerPublishTime', 0), reverse=True)
+
+    for item in all_news:
+        if item['title'] not in seen_titles:
+            unique_news.append(item)
+            seen_titles.add(item['title'])
+
+    return unique_news[:limit]
+
 def fetch_top_market_news(limit: int = 15) -> List[Dict]:
     """
     Fetch top market news covering:
@@ -102,32 +147,25 @@ def fetch_top_market_news(limit: int = 15) -> List[Dict]:
     2. Global Markets (impacting India)
     3. Economy & Trends
     """
-    topics = [
-        "Nifty 50 stock market news",
-        "Sensex live news",
-        "Indian economy news",
-        "Global stock market news India impact"
-    ]
-    
     all_news = []
-    for topic in topics:
+    for topic in MARKET_NEWS_TOPICS:
         try:
             # Fetch 5 items per topic
             topic_news = fetch_google_news_rss(topic, limit=5)
             all_news.extend(topic_news)
         except Exception:
             continue
-            
-    # Deduplicate and sort by time
-    seen_titles = set()
-    unique_news = []
-    
-    # Sort by time descending (newest first)
-    all_news.sort(key=lambda x: x.get('providerPublishTime', 0), reverse=True)
-    
-    for item in all_news:
-        if item['title'] not in seen_titles:
-            unique_news.append(item)
-            seen_titles.add(item['title'])
-            
-    return unique_news[:limit]
+
+    return _merge_market_news(all_news, limit)
+
+async def fetch_top_market_news_async(client, limit: int = 15) -> List[Dict]:
+    """
+    Same as fetch_top_market_news, but fetches all topics concurrently
+    over a shared httpx.AsyncClient
+    """
+    results = await asyncio.gather(
+        *(fetch_google_news_rss_async(client, topic, limit=5) for topic in MARKET_NEWS_TOPICS)
+    )
+
+    all_news = [item for topic_news in results for item in topic_news]
+    return _merge_market_news(all_news, limit)
@@ -0,0 +1,87 @@
+"""
+Response Cache
+In-process TTL caches for signal and backtest endpoints,
+optionally mirrored to Redis so multiple workers share results
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+
+# Signals are refreshed often; 10-year backtests barely move intra-day
+SIGNALS_TTL = 60  # seconds
+BACKTEST_TTL = 3600  # seconds
+
+signals_cache = TTLCache(maxsize=256, ttl=SIGNALS_TTL)
+backtest_cache = TTLCache(maxsize=256, ttl=BACKTEST_TTL)
+
+_TTLS = {"signals": SIGNALS_TTL, "backtest": BACKTEST_TTL}
+_CACHES = {"signals": signals_cache, "backtest": backtest_cache}
+
+logger = logging.getLogger("protrader")
+
+# Optional Redis mirror for multi-worker deployments
+redis_client = None
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    try:
+        import redis
+        redis_client = redis.Redis.from_url(REDIS_URL)
+    except ImportError:
+        logger.warning("redis not installed. Response cache will not be shared across workers.")
+
+
+def _redis_key(namespace: str, key: tuple) -> str:
+    return "protrader:" + namespace + ":" + ":".join(str(k) for k in key)
+
+
+def get_cached(namespace: str, key: tuple) -> Optional[Dict[str, Any]]:
+    """Look up a cached response, falling back to Redis on a local miss"""
+    cache = _CACHES[namespace]
+    value = cache.get(key)
+    if value is not None or redis_client is None:
+        return value
+
+    try:
+        raw = redis_client.get(_redis_key(namespace, key))
+    except Exception as e:
+        logger.warning("Redis read error for %s: %s", key, e)
+        return None
+
+    if raw is None:
+        return None
+    value = orjson.loads(raw)
+    cache[key] = value
+    return value
+
+
+def set_cached(namespace: str, key: tuple, value: Dict[str, Any]):
+    """Store a response locally and publish it to Redis if configured"""
+    _CACHES[namespace][key] = value
+    if redis_client is None:
+        return
+
+    try:
+        redis_client.setex(_redis_key(namespace, key), _TTLS[namespace], orjson.dumps(value, default=str, option=orjson.OPT_SERIALIZE_NUMPY))
+    except Exception as e:
+        logger.warning("Redis write error for %s: %s", key, e)
+
+
+def clear_response_cache() -> Dict[str, Any]:
+    """Clear signal and backtest caches"""
+    cleared = len(signals_cache) + len(backtest_cache)
+    signals_cache.clear()
+    backtest_cache.clear()
+
+    if redis_client is not None:
+        try:
+            keys = list(redis_client.scan_iter("protrader:*"))
+            if keys:
+                redis_client.delete(*keys)
+        except Exception as e:
+            return {"error": f"Failed to clear Redis cache: {str(e)}"}
+
+    return {"message": "Signal cache cleared successfully", "entries_cleared": cleared}
@@ -2,52 +2,217 @@
 Sentiment Analysis using VADER
 """
 
+import bisect
+import functools
+import logging
+import mmap
+import os
+import pickle
+import re
+import threading
+import time
+import numpy as np
+from cachetools import TTLCache
+from pathlib import Path
+from vaderSentiment import vaderSentiment as vader_module
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from typing import List, Dict
+from typing import List, Dict, Tuple
+from news_aggregator import get_aggregated_news
 
-# Initialize VADER
-vader_analyzer = SentimentIntensityAnalyzer()
+logger = logging.getLogger("protrader")
+
+# Parsed VADER lexicon, pickled on first start so later worker processes skip re-parsing ~7500 lines
+VADER_LEXICON_SOURCE = Path(vader_module.__file__).parent / "vader_lexicon.txt"
+VADER_LEXICON_PICKLE = Path(__file__).parent / "cache" / "vader_lexicon.pkl"
+
+
+class FastVaderAnalyzer(SentimentIntensityAnalyzer):
+    """
+    SentimentIntensityAnalyzer with a faster cold start and hot path, same scores
+    - loads its lexicon dict from a pickle when one is up to date
+    - negation/idiom checks see only the words around the current one
+    """
+
+    def make_lex_dict(self):
+        try:
+            stat = VADER_LEXICON_SOURCE.stat()
+            source_key = (stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            return super().make_lex_dict()
+
+        try:
+            with open(VADER_LEXICON_PICKLE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                cached_key, lex_dict = pickle.loads(mm)
+            if cached_key == source_key:
+                return lex_dict
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            pass
+
+        lex_dict = super().make_lex_dict()
+        try:
+            VADER_LEXICON_PICKLE.parent.mkdir(exist_ok=True)
+            tmp_path = VADER_LEXICON_PICKLE.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((source_key, lex_dict), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, VADER_LEXICON_PICKLE)
+        except OSError as e:
+            logger.warning("Could not write VADER lexicon cache: %s", e)
+        return lex_dict
+
+    # The stock checks lowercase the whole sentence on every call (quadratic in word count)
+    # but only read words i-3..i+2, so hand them that window with i re-based onto it
+    def _negation_check(self, valence, words_and_emoticons, start_i, i):
+        lo = max(0, i - 3)
+        return SentimentIntensityAnalyzer._negation_check(valence, words_and_emoticons[lo:i + 3], start_i, i - lo)
+
+    def _special_idioms_check(self, valence, words_and_emoticons, i):
+        lo = max(0, i - 3)
+        return SentimentIntensityAnalyzer._special_idioms_check(valence, words_and_emoticons[lo:i + 3], i - lo)
+
+
+# Initialize VADER once per process; every caller shares this instance
+# (construction loads the lexicon and emoji tables from disk)
+vader_analyzer = FastVaderAnalyzer()
+
+# Buckets for averaged news sentiment (ascending). Scores must pass a threshold strictly
+# to leave Neutral, so each boundary belongs to the bucket nearer zero
+NEWS_SENTIMENT_THRESHOLDS = np.array([-0.3, -0.1, 0.1, 0.3])
+NEWS_SENTIMENT_LABELS = ("Very Bearish", "Bearish", "Neutral", "Bullish", "Very Bullish")
+NEWS_SENTIMENT_COLORS = ("red", "orange", "gray", "lightgreen", "green")
+
+# Compound-score buckets shared by categorize_sentiment / get_market_sentiment_indicator.
+# Boundaries belong to the outer (non-neutral) bucket on the categorize_sentiment side
+# and to the inner bucket on the market-indicator side, mirroring the original ladders.
+SENTIMENT_THRESHOLDS = (-0.5, -0.2, -0.05, 0.05, 0.2, 0.5)
+_SENTIMENT_THRESHOLDS_ARR = np.array(SENTIMENT_THRESHOLDS)
+SENTIMENT_LABELS = ("Very Bearish", "Bearish", "Slightly Bearish", "Neutral",
+                    "Slightly Bullish", "Bullish", "Very Bullish")
+SENTIMENT_COLORS = ("darkred", "red", "orange", "gray", "lightgreen", "green", "darkgreen")
+MARKET_INDICATOR_LABELS = ("Extremely Bearish", "Bearish", "Slightly Bearish", "Neutral",
+                           "Slightly Bullish", "Bullish", "Extremely Bullish")
+
+# Memoize VADER on repeated headlines (aggregator duplicates, re-polls within the cache window)
+VADER_CACHE_SIZE = 4096
+VADER_CACHE_MAX_TEXT = 512  # longer texts bypass the cache to bound memory
+VADER_CACHE_RESET_SECONDS = 24 * 60 * 60
+_vader_cache_reset_at = time.monotonic() + VADER_CACHE_RESET_SECONDS
+
+# Guard against VADER's pathological slowdown on long emoticon/punctuation runs
+# (vaderSentiment issue #110: a short text with a long run can take ~50s).
+# VADER caps "!"/"?" emphasis at 4 and 3 repeats, so collapsing longer runs keeps scores unchanged.
+_REPEATED_SYMBOL_RE = re.compile(r'([^\w\s])\1{3,}')
+VADER_MAX_TEXT = 4096
+
+def _sanitize_for_vader(text: str) -> str:
+    text = _REPEATED_SYMBOL_RE.sub(lambda m: m.group(0)[:4], text[:VADER_MAX_TEXT])
+    return text.strip()
+
+def _polarity_tuple(text: str) -> Tuple[float, float, float, float]:
+    scores = vader_analyzer.polarity_scores(text)
+    return (scores['pos'], scores['neg'], scores['neu'], scores['compound'])
+
+_cached_polarity_tuple = functools.lru_cache(maxsize=VADER_CACHE_SIZE)(_polarity_tuple)
+
+def polarity_tuple(text: str) -> Tuple[float, float, float, float]:
+    """VADER (positive, negative, neutral, compound) for text, memoized for repeats"""
+    global _vader_cache_reset_at
+
+    # Surrounding whitespace does not change VADER's tokens, so strip it to share cache entries
+    text = _sanitize_for_vader(text)
+    if len(text) > VADER_CACHE_MAX_TEXT:
+        return _polarity_tuple(text)
+
+    now = time.monotonic()
+    if now >= _vader_cache_reset_at:
+        _cached_polarity_tuple.cache_clear()
+        _vader_cache_reset_at = now + VADER_CACHE_RESET_SECONDS
+
+    return _cached_polarity_tuple(text)
+
+# Compound score per article link: market-wide stories show up under many tickers,
+# so a Nifty 50 screen reuses scores for the same window as the screener cache
+_link_compounds = TTLCache(maxsize=8192, ttl=15 * 60)
+_link_compounds_lock = threading.Lock()
+
+def _compound_for_link(link: str, text: str) -> float:
+    """VADER compound for an article, memoized by its link when it has one"""
+    if not link or link == '#':
+        return polarity_tuple(text)[3]
+
+    with _link_compounds_lock:
+        compound = _link_compounds.get(link)
+    if compound is None:
+        compound = polarity_tuple(text)[3]
+        with _link_compounds_lock:
+            _link_compounds[link] = compound
+    return compound
 
 def analyze_sentiment_vader(text: str) -> Dict[str, float]:
     """Analyze sentiment using VADER"""
-    scores = vader_analyzer.polarity_scores(text)
+    pos, neg, neu, compound = polarity_tuple(text)
     return {
-        "positive": scores['pos'],
-        "negative": scores['neg'],
-        "neutral": scores['neu'],
-        "compound": scores['compound']
+        "positive": pos,
+        "negative": neg,
+        "neutral": neu,
+        "compound": compound
     }
 
+def batch_polarity_scores(texts: List[str]) -> np.ndarray:
+    """
+    Score many texts with VADER in one pass
+    Returns an (n, 4) array with columns positive, negative, neutral, compound
+    """
+    out = np.empty((len(texts), 4), dtype=np.float64)
+    for i, text in enumerate(texts):
+        out[i] = polarity_tuple(text)
+    return out
+
+def _sentiment_row_to_dict(row: np.ndarray) -> Dict[str, float]:
+    """Convert one batch_polarity_scores row to the analyze_sentiment_vader dict"""
+    pos, neg, neu, compound = row.tolist()
+    return {"positive": pos, "negative": neg, "neutral": neu, "compound": compound}
+
 def categorize_sentiment(compound_score: float) -> Dict[str, str]:
     """Categorize sentiment score into labels"""
-    if compound_score >= 0.5:
-        return {"label": "Very Bullish", "color": "darkgreen"}
-    elif compound_score >= 0.2:
-        return {"label": "Bullish", "color": "green"}
-    elif compound_score >= 0.05:
-        return {"label": "Slightly Bullish", "color": "lightgreen"}
-    elif compound_score <= -0.5:
-        return {"label": "Very Bearish", "color": "darkred"}
-    elif compound_score <= -0.2:
-        return {"label": "Bearish", "color": "red"}
-    elif compound_score <= -0.05:
-        return {"label": "Slightly Bearish", "color": "orange"}
+    if compound_score >= 0:
+        i = bisect.bisect_right(SENTIMENT_THRESHOLDS, compound_score)
     else:
-        return {"label": "Neutral", "color": "gray"}
+        i = bisect.bisect_left(SENTIMENT_THRESHOLDS, compound_score)
+    return {"label": SENTIMENT_LABELS[i], "color": SENTIMENT_COLORS[i]}
+
+def categorize_batch(compound_scores: np.ndarray) -> np.ndarray:
+    """Vectorized categorize_sentiment: bucket index per score into SENTIMENT_LABELS/COLORS"""
+    return np.where(
+        compound_scores >= 0,
+        np.searchsorted(_SENTIMENT_THRESHOLDS_ARR, compound_scores, side='right'),
+        np.searchsorted(_SENTIMENT_THRESHOLDS_ARR, compound_scores, side='left')
+    )
+
+def categorize_news_sentiment(avg_compound: float) -> Dict[str, str]:
+    """Categorize an averaged news compound score into labels"""
+    side = 'left' if avg_compound >= 0 else 'right'
+    i = int(np.searchsorted(NEWS_SENTIMENT_THRESHOLDS, avg_compound, side=side))
+    return {"label": NEWS_SENTIMENT_LABELS[i], "color": NEWS_SENTIMENT_COLORS[i]}
 
 def analyze_news_sentiment(news_items: List[Dict[str, str]]) -> Dict:
     """Analyze sentiment of multiple news articles"""
-    sentiments = []
+    titles = []
+    texts = []
     for item in news_items:
-        text = f"{item.get('title', '')} {item.get('description', '')}"
-        sentiment = analyze_sentiment_vader(text)
-        sentiments.append({
-            "title": item.get('title', '')[:50],
-            "sentiment": sentiment
-        })
-    
-    if sentiments:
-        avg_compound = sum(s["sentiment"]["compound"] for s in sentiments) / len(sentiments)
+        title = item.get('title', '')
+        text = " ".join(p for p in (title, item.get('description', '')) if p)
+        if not text:
+            continue
+        titles.append(title)
+        texts.append(text)
+
+    if texts:
+        scores = batch_polarity_scores(texts)
+        sentiments = [
+            {"title": title[:50], "sentiment": _sentiment_row_to_dict(row)}
+            for title, row in zip(titles, scores)
+        ]
+        avg_compound = float(scores[:, 3].mean())
         category = categorize_sentiment(avg_compound)
         return {
             "average_compound": avg_compound,
@@ -66,44 +231,34 @@ def analyze_news_sentiment(news_items: List[Dict[str, str]]) -> Dict:
 
 def get_market_sentiment_indicator(sentiment_score: float) -> str:
     """Convert sentiment score to market indicator"""
-    if sentiment_score > 0.5:
-        return "Extremely Bullish"
-    elif sentiment_score > 0.2:
-        return "Bullish"
-    elif sentiment_score > 0.05:
-        return "Slightly Bullish"
-    elif sentiment_score < -0.5:
-        return "Extremely Bearish"
-    elif sentiment_score < -0.2:
-        return "Bearish"
-    elif sentiment_score < -0.05:
-        return "Slightly Bearish"
+    if sentiment_score >= 0:
+        i = bisect.bisect_left(SENTIMENT_THRESHOLDS, sentiment_score)
     else:
-        return "Neutral"
+        i = bisect.bisect_right(SENTIMENT_THRESHOLDS, sentiment_score)
+    return MARKET_INDICATOR_LABELS[i]
 
 def batch_analyze_sentiment(texts: List[str]) -> List[Dict]:
     """Analyze sentiment for multiple texts efficiently"""
     results = []
-    for text in texts:
-        sentiment = analyze_sentiment_vader(text)
-        category = categorize_sentiment(sentiment["compound"])
+    scores = batch_polarity_scores(texts)
+    buckets = categorize_batch(scores[:, 3])
+    for text, row, i in zip(texts, scores, buckets.tolist()):
         results.append({
             "text": text[:100] + "..." if len(text) > 100 else text,
-            "sentiment": sentiment,
-            "label": category["label"],
-            "color": category["color"]
+            "sentiment": _sentiment_row_to_dict(row),
+            "label": SENTIMENT_LABELS[i],
+            "color": SENTIMENT_COLORS[i]
         })
     return results
 
 
-def get_real_sentiment_score(ticker: str) -> Dict:
+def get_real_sentiment_score(ticker: str, detail: bool = True) -> Dict:
     """
     Get REAL sentiment score for a stock ticker using yfinance news + VADER
     Returns score 0-100 (not hardcoded 50!)
+
+    detail: include the per-article "news" list; pass False when only the aggregate score is used
     """
-    import yfinance as yf
-    from news_aggregator import get_aggregated_news
-    
     try:
         # Use our new robust aggregator
         news = get_aggregated_news(ticker)
@@ -119,31 +274,23 @@ def get_real_sentiment_score(ticker: str) -> Dict:
                 "note": "No recent news found"
             }
         
-        # Analyze each news article
-        sentiments = []
-        analyzed_news = []
+        # Collect analyzable text for each news article
+        articles = []
+        titles = []
+        texts = []
         for article in news[:10]:  # Limit to 10 most recent
             title = article.get('title', '')
             # Some articles have 'summary' or 'description'
             summary = article.get('summary', '') or article.get('description', '')
-            text = f"{title} {summary}"
-            
-            if text.strip():
-                sentiment = analyze_sentiment_vader(text)
-                sentiments.append(sentiment['compound'])
-                
-                # Add to analyzed news list
-                item_category = categorize_sentiment(sentiment['compound'])
-                analyzed_news.append({
-                    "title": title,
-                    "link": article.get('link', '#'),
-                    "publisher": article.get('publisher', 'Yahoo Finance'),
-                    "providerPublishTime": article.get('providerPublishTime', 0),
-                    "sentiment": item_category['label'],
-                    "sentiment_score": sentiment['compound']
-                })
-        
-        if not sentiments:
+            text = " ".join(p for p in (title, summary) if p)
+            if not text:
+                continue
+
+            articles.append(article)
+            titles.append(title)
+            texts.append(text)
+
+        if not texts:
             return {
                 "score": 50,
                 "compound": 0,
@@ -153,8 +300,29 @@ def get_real_sentiment_score(ticker: str) -> Dict:
                 "note": "No analyzable news content"
             }
         
+        # Score all articles, reusing scores for links already seen under other tickers
+        compounds = np.fromiter(
+            (_compound_for_link(article.get('link'), text) for article, text in zip(articles, texts)),
+            dtype=np.float64,
+            count=len(texts)
+        )
+
+        article_count = len(texts)
+        analyzed_news = []
+        if detail:
+            for article, title, compound in zip(articles, titles, compounds.tolist()):
+                item_category = categorize_sentiment(compound)
+                analyzed_news.append({
+                    "title": title,
+                    "link": article.get('link', '#'),
+                    "publisher": article.get('publisher', 'Yahoo Finance'),
+                    "providerPublishTime": article.get('providerPublishTime', 0),
+                    "sentiment": item_category['label'],
+                    "sentiment_score": compound
+                })
+
         # Calculate average sentiment
-        avg_compound = sum(sentiments) / len(sentiments)
+        avg_compound = float(compounds.mean())
         
         # Convert compound (-1 to 1) to score (0 to 100)
         # -1 = 0, 0 = 50, 1 = 100
@@ -163,15 +331,17 @@ def get_real_sentiment_score(ticker: str) -> Dict:
         
         category = categorize_sentiment(avg_compound)
         
-        return {
+        result = {
             "score": score,
             "compound": round(avg_compound, 4),
             "label": category["label"],
             "color": category["color"],
-            "article_count": len(sentiments),
-            "news": analyzed_news,
-            "note": f"Analyzed {len(sentiments)} recent articles"
+            "article_count": article_count
         }
+        if detail:
+            result["news"] = analyzed_news
+        result["note"] = f"Analyzed {article_count} recent articles"
+        return result
         
     except Exception as e:
         # On error, return neutral with error note
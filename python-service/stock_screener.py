@@ -4,25 +4,38 @@ Analyzes Nifty 50 stocks without hitting Yahoo Finance rate limits
 """
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
-import json
+import heapq
+import logging
+import orjson
+import random
+import sqlite3
 import time
 from datetime import datetime, timedelta
-from typing import Dict, List
+from collections import defaultdict, namedtuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import threading
-from trading_signals import analyze_trading_signals
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from trading_signals import analyze_trading_signals, is_transient_error
 from enhanced_signals import enhance_trading_signals
 
+logger = logging.getLogger("protrader")
+
 # Cache configuration
 CACHE_DIR = Path(__file__).parent / "cache"
 CACHE_DIR.mkdir(exist_ok=True)
+CACHE_DB = CACHE_DIR / "cache.db"
 CACHE_DURATION = timedelta(minutes=15)  # Refresh every 15 minutes
 
 # Rate limiting configuration
 REQUEST_DELAY = 0.5  # 500ms between requests = 2 requests/second (safe)
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+RETRY_BASE_DELAY = 0.5  # seconds; doubles per attempt (0.5s, 1s, 2s...) plus jitter
+RETRY_MAX_DELAY = 8  # seconds
+RETRY_JITTER = 0.5  # seconds
+MAX_WORKERS = 8  # parallel fetches; the rate limiter still caps aggregate QPS
 
 # Nifty 50 stocks list (as of 2025)
 NIFTY_50_STOCKS = [
@@ -86,55 +99,141 @@ def get_sector(ticker: str) -> str:
     """Get sector for a stock ticker"""
     return STOCK_SECTORS.get(ticker, "Other")
 
+# Integer sector ids for vectorized per-sector aggregation
+SECTOR_NAMES = sorted(set(STOCK_SECTORS.values()) | {"Other"})
+_SECTOR_IDS = {sector: i for i, sector in enumerate(SECTOR_NAMES)}
+_OTHER_SECTOR_ID = _SECTOR_IDS["Other"]
+_TICKER_SECTOR_ID = {ticker: _SECTOR_IDS[sector] for ticker, sector in STOCK_SECTORS.items()}
+
 class StockCache:
-    """Thread-safe cache for stock data"""
+    """
+    Thread-safe cache for stock data
+    Single SQLite database in WAL mode: readers never block each other
+    and writes don't block reads, so parallel screens don't serialize on one lock
+    """
 
-    def __init__(self):
-        self.cache = {}
-        self.lock = threading.Lock()
+    def __init__(self, db_path: Path = CACHE_DB):
+        self.db_path = db_path
+        self.local = threading.local()  # one connection per thread
+        self.max_age = CACHE_DURATION.total_seconds()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "ticker TEXT PRIMARY KEY, cached_at REAL NOT NULL, signals BLOB NOT NULL)"
+            )
+            self.local.conn = conn
+        return conn
 
     def get(self, ticker: str) -> Dict:
         """Get cached data if fresh"""
-        with self.lock:
-            cache_file = CACHE_DIR / f"{ticker.replace('.', '_')}.json"
-
-            # Check file cache
-            if cache_file.exists():
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
+        try:
+            row = self._connection().execute(
+                "SELECT cached_at, signals FROM cache WHERE ticker = ?", (ticker,)
+            ).fetchone()
 
-                    cached_time = datetime.fromisoformat(data['cached_at'])
-                    if datetime.now() - cached_time < CACHE_DURATION:
-                        return data['signals']
-                except Exception as e:
-                    print(f"Cache read error for {ticker}: {e}")
+            if row and time.time() - row[0] < self.max_age:
+                return orjson.loads(row[1])
+        except Exception as e:
+            print(f"Cache read error for {ticker}: {e}")
 
-            return None
+        return None
 
     def set(self, ticker: str, signals: Dict):
         """Save data to cache"""
-        with self.lock:
-            cache_file = CACHE_DIR / f"{ticker.replace('.', '_')}.json"
-
-            try:
-                cache_data = {
-                    'ticker': ticker,
-                    'cached_at': datetime.now().isoformat(),
-                    'signals': signals
-                }
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (ticker, cached_at, signals) VALUES (?, ?, ?)",
+                    (ticker, time.time(), orjson.dumps(signals, option=orjson.OPT_SERIALIZE_NUMPY))
+                )
+        except Exception as e:
+            print(f"Cache write error for {ticker}: {e}")
 
-                with open(cache_file, 'w') as f:
-                    json.dump(cache_data, f)
-            except Exception as e:
-                print(f"Cache write error for {ticker}: {e}")
+    def clear(self):
+        """Remove all cached entries"""
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM cache")
 
 # Global cache instance
 stock_cache = StockCache()
 
-def get_stock_signals_cached(ticker: str) -> Dict:
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least `interval` seconds apart"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block until this caller's slot comes up"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+
+        if slot > now:
+            time.sleep(slot - now)
+
+# Shared across worker threads so parallel fetches stay within REQUEST_DELAY
+rate_limiter = RateLimiter(REQUEST_DELAY)
+
+def download_history_batch(tickers: List[str], period: str = "1y") -> Dict[str, pd.DataFrame]:
+    """
+    Download daily history for many tickers in a single batched yfinance request
+    Returns {ticker: DataFrame}; tickers that failed to download are omitted
+    """
+    if not tickers:
+        return {}
+
+    try:
+        data = yf.download(
+            tickers=" ".join(tickers),
+            period=period,
+            interval="1d",
+            group_by="ticker",
+            auto_adjust=True,
+            threads=True,
+            progress=False
+        )
+    except Exception as e:
+        logger.warning("Batch download failed, falling back to per-ticker fetches: %s", e)
+        return {}
+
+    if data.empty:
+        return {}
+
+    if not isinstance(data.columns, pd.MultiIndex):
+        return {tickers[0]: data}
+
+    histories = {}
+    for ticker in tickers:
+        if ticker not in data.columns.get_level_values(0):
+            continue
+        df = data[ticker].dropna(how='all')
+        if not df.empty:
+            histories[ticker] = df
+
+    return histories
+
+def retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given 0-based attempt"""
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) + random.random() * RETRY_JITTER
+
+def get_stock_signals_cached(ticker: str, history: Optional[pd.DataFrame] = None,
+                             timestamp: Optional[str] = None) -> Dict:
     """
     Get stock signals with caching and rate limiting
+    history: optional pre-fetched daily history to skip the per-ticker download
+    timestamp: analysis time shared by a batch screen (defaults to now)
     """
     # Check cache first
     cached_data = stock_cache.get(ticker)
@@ -145,10 +244,12 @@ def get_stock_signals_cached(ticker: str) -> Dict:
     for attempt in range(MAX_RETRIES):
         try:
             # Rate limiting delay
-            time.sleep(REQUEST_DELAY)
+            rate_limiter.wait()
 
-            # Analyze signals with enhancements
-            signals = analyze_trading_signals(ticker)
+            # Analyze signals with enhancements (screens only use the aggregate sentiment score);
+            # transient fetch errors are raised to the retry below instead of coming back as error dicts
+            signals = analyze_trading_signals(ticker, history, sentiment_detail=False, timestamp=timestamp,
+                                              raise_transient=True)
 
             # Enhance signals (score capping, conflict detection, risk management)
             if 'error' not in signals:
@@ -158,22 +259,70 @@ def get_stock_signals_cached(ticker: str) -> Dict:
             return signals
 
         except Exception as e:
+            if not is_transient_error(e):
+                # Bad ticker, missing data, parse errors: retrying won't help
+                return {
+                    "error": f"Failed to fetch signals: {str(e)}",
+                    "ticker": ticker
+                }
             if attempt < MAX_RETRIES - 1:
-                print(f"Retry {attempt + 1} for {ticker}: {e}")
-                time.sleep(RETRY_DELAY)
+                # The next attempt still takes a rate limiter slot, but that slot is usually
+                # free by the time the backoff ends, so the two waits overlap rather than add up
+                delay = retry_delay(attempt)
+                logger.warning("Retry %d for %s in %.1fs: %s", attempt + 1, ticker, delay, e)
+                time.sleep(delay)
             else:
                 return {
                     "error": f"Failed after {MAX_RETRIES} attempts: {str(e)}",
                     "ticker": ticker
                 }
 
+def iter_screen_nifty50(force_refresh: bool = False) -> Iterator[Tuple[str, Dict, bool]]:
+    """
+    Screen Nifty 50 stocks, yielding (ticker, signals, from_cache) as each one is ready
+    Fresh cache entries are yielded first, then fetched stocks in completion order
+    signals may be an error dict ({"error": ..., "ticker": ...})
+    """
+    # Serve fresh cache entries first
+    pending = []
+    for ticker in NIFTY_50_STOCKS:
+        if not force_refresh:
+            cached = stock_cache.get(ticker)
+            if cached:
+                yield ticker, cached, True
+                continue
+        pending.append(ticker)
+
+    if not pending:
+        return
+
+    # One batched price download for everything that needs a refresh
+    histories = download_history_batch(pending)
+    timestamp = datetime.now().isoformat()
+
+    # Fetch fresh data in parallel; waits overlap while the rate limiter paces requests
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    try:
+        futures = {
+            executor.submit(get_stock_signals_cached, ticker, histories.get(ticker), timestamp): ticker
+            for ticker in pending
+        }
+
+        for i, future in enumerate(as_completed(futures)):
+            ticker = futures[future]
+            logger.debug("Fetched %s (%d/%d)", ticker, i + 1, len(pending))
+            yield ticker, future.result(), False
+    finally:
+        # Don't keep fetching if the consumer stopped early (e.g. client disconnected)
+        executor.shutdown(wait=False, cancel_futures=True)
+
 def screen_nifty50(force_refresh: bool = False) -> Dict:
     """
     Screen all Nifty 50 stocks with intelligent caching
 
     Time estimate:
     - With cache: <1 second (instant)
-    - Cold start: ~25-50 seconds (50 stocks × 0.5s delay)
+    - Cold start: bounded by the rate limiter (50 stocks × 0.5s slots), fetches overlap
     - Partial refresh: 5-15 seconds (only stale data)
     """
     start_time = time.time()
@@ -184,20 +333,11 @@ def screen_nifty50(force_refresh: bool = False) -> Dict:
 
     print(f"Starting Nifty 50 screening... (force_refresh={force_refresh})")
 
-    for i, ticker in enumerate(NIFTY_50_STOCKS):
-        # Check cache first if not forcing refresh
-        if not force_refresh:
-            cached = stock_cache.get(ticker)
-            if cached:
-                results.append(cached)
-                cache_hits += 1
-                continue
-
-        # Fetch fresh data
-        print(f"Fetching {ticker} ({i+1}/{len(NIFTY_50_STOCKS)})...")
-        signals = get_stock_signals_cached(ticker)
-
-        if 'error' in signals:
+    for ticker, signals, from_cache in iter_screen_nifty50(force_refresh):
+        if from_cache:
+            results.append(signals)
+            cache_hits += 1
+        elif 'error' in signals:
             errors.append(signals)
         else:
             results.append(signals)
@@ -226,108 +366,123 @@ def screen_nifty50(force_refresh: bool = False) -> Dict:
         "errors": errors
     }
 
+# Flat per-stock view so the sorts/filters below read plain attributes
+StockView = namedtuple(
+    'StockView',
+    'ticker overall_score overall_signal fund_score tech_score swing_score intraday_score '
+    'vwap_score rsi vol_ratio conflict_count confidence longterm_signal raw'
+)
+
+def make_stock_view(s: Dict) -> StockView:
+    """Pull the fields categorize_stocks needs out of a signals dict once"""
+    overall = s.get('overall_signal', {})
+    key_indicators = s.get('key_indicators', {})
+    timeframes = s.get('timeframe_signals', {})
+    return StockView(
+        ticker=s.get('ticker'),
+        overall_score=overall.get('score', 0),
+        overall_signal=overall.get('signal'),
+        fund_score=s.get('fundamental_analysis', {}).get('score', 0),
+        tech_score=s.get('technical_analysis', {}).get('score', 0),
+        swing_score=timeframes.get('swing', {}).get('score', 0),
+        intraday_score=timeframes.get('intraday', {}).get('score', 0),
+        vwap_score=s.get('vwap_strategy', {}).get('score', 0),
+        rsi=key_indicators.get('rsi', 50),
+        vol_ratio=key_indicators.get('volume_ratio', 0),
+        conflict_count=s.get('signal_conflicts', {}).get('conflict_count', 99),
+        confidence=s.get('confidence_level', 'Low'),
+        longterm_signal=timeframes.get('long_term', {}).get('signal'),
+        raw=s
+    )
+
 def categorize_stocks(stocks: List[Dict]) -> Dict:
     """
     Categorize stocks by various criteria
     """
+    views = [make_stock_view(s) for s in stocks]
+
     # Best overall stocks (high overall score)
-    best_stocks = sorted(
-        stocks,
-        key=lambda x: x.get('overall_signal', {}).get('score', 0),
-        reverse=True
-    )[:10]
+    best_stocks = heapq.nlargest(10, views, key=lambda v: v.overall_score)
 
     # Best for long-term (high fundamental score)
-    best_longterm = sorted(
-        stocks,
-        key=lambda x: x.get('fundamental_analysis', {}).get('score', 0),
-        reverse=True
-    )[:10]
+    best_longterm = heapq.nlargest(10, views, key=lambda v: v.fund_score)
 
     # Best for intraday (high VWAP strategy score)
-    best_intraday = sorted(
-        [s for s in stocks if s.get('vwap_strategy', {}).get('score', 0) > 50],
-        key=lambda x: x.get('vwap_strategy', {}).get('score', 0),
-        reverse=True
-    )[:10]
+    best_intraday = heapq.nlargest(
+        10,
+        [v for v in views if v.vwap_score > 50],
+        key=lambda v: v.vwap_score
+    )
 
     # Best for swing (high technical + momentum)
-    best_swing = sorted(
-        stocks,
-        key=lambda x: (
-            x.get('technical_analysis', {}).get('score', 0) * 0.6 +
-            x.get('timeframe_signals', {}).get('swing', {}).get('score', 0) * 0.4
-        ),
-        reverse=True
-    )[:10]
+    best_swing = heapq.nlargest(
+        10,
+        views,
+        key=lambda v: v.tech_score * 0.6 + v.swing_score * 0.4
+    )
 
     # Strong buy signals - FIXED: More realistic criteria
     # Look for high confidence + good scores, not just signal label
-    strong_buy = sorted(
-        [s for s in stocks if (
+    strong_buy = heapq.nlargest(
+        10,
+        [v for v in views if (
             # High overall score
-            s.get('overall_signal', {}).get('score', 0) >= 60 and
+            v.overall_score >= 60 and
             # High confidence (or at least medium)
-            s.get('confidence_level', 'Low') in ['High', 'Medium'] and
+            v.confidence in ('High', 'Medium') and
             # Low conflict count (max 1)
-            s.get('signal_conflicts', {}).get('conflict_count', 99) <= 1 and
+            v.conflict_count <= 1 and
             # Decent volume
-            s.get('key_indicators', {}).get('volume_ratio', 0) >= 0.7 and
+            v.vol_ratio >= 0.7 and
             # Either BUY signal OR high score with bullish timeframes
-            (s.get('overall_signal', {}).get('signal') in ['STRONG BUY', 'BUY'] or
-             (s.get('overall_signal', {}).get('score', 0) >= 65 and
-              s.get('timeframe_signals', {}).get('long_term', {}).get('signal') == 'BUY'))
+            (v.overall_signal in ('STRONG BUY', 'BUY') or
+             (v.overall_score >= 65 and v.longterm_signal == 'BUY'))
         )],
-        key=lambda x: x.get('overall_signal', {}).get('score', 0),
-        reverse=True
-    )[:10]
+        key=lambda v: v.overall_score
+    )
 
     # Strong sell signals - FIXED: More realistic criteria
-    strong_sell = sorted(
-        [s for s in stocks if (
+    strong_sell = heapq.nsmallest(
+        10,
+        [v for v in views if (
             # Low overall score
-            s.get('overall_signal', {}).get('score', 0) <= 40 and
+            v.overall_score <= 40 and
             # Either SELL signal OR low score with bearish timeframes
-            (s.get('overall_signal', {}).get('signal') in ['STRONG SELL', 'SELL'] or
-             (s.get('overall_signal', {}).get('score', 0) <= 35 and
-              s.get('timeframe_signals', {}).get('long_term', {}).get('signal') == 'SELL'))
+            (v.overall_signal in ('STRONG SELL', 'SELL') or
+             (v.overall_score <= 35 and v.longterm_signal == 'SELL'))
         )],
-        key=lambda x: x.get('overall_signal', {}).get('score', 0)
-    )[:10]
+        key=lambda v: v.overall_score
+    )
 
     # Top gainers (positive momentum)
-    gainers = sorted(
-        [s for s in stocks if s.get('key_indicators', {}).get('rsi', 50) > 50],
-        key=lambda x: x.get('key_indicators', {}).get('rsi', 0),
-        reverse=True
-    )[:10]
+    gainers = heapq.nlargest(10, [v for v in views if v.rsi > 50], key=lambda v: v.rsi)
 
     # Top losers (negative momentum)
-    losers = sorted(
-        [s for s in stocks if s.get('key_indicators', {}).get('rsi', 50) < 50],
-        key=lambda x: x.get('key_indicators', {}).get('rsi', 0)
-    )[:10]
+    losers = heapq.nsmallest(10, [v for v in views if v.rsi < 50], key=lambda v: v.rsi)
 
     # Value picks (low P/E, high score)
-    value_picks = sorted(
-        [s for s in stocks if s.get('fundamental_analysis', {}).get('score', 0) > 60],
-        key=lambda x: x.get('fundamental_analysis', {}).get('score', 0),
-        reverse=True
-    )[:10]
+    value_picks = heapq.nlargest(
+        10,
+        [v for v in views if v.fund_score > 60],
+        key=lambda v: v.fund_score
+    )
 
     # Sector analysis - Calculate average score per sector
     sector_performance = analyze_sector_performance(stocks)
 
+    def format_views(selected: List[StockView]) -> List[Dict]:
+        return format_stock_list([v.raw for v in selected])
+
     return {
-        "best_overall": format_stock_list(best_stocks),
-        "best_longterm": format_stock_list(best_longterm),
-        "best_intraday": format_stock_list(best_intraday),
-        "best_swing": format_stock_list(best_swing),
-        "strong_buy": format_stock_list(strong_buy),
-        "strong_sell": format_stock_list(strong_sell),
-        "top_gainers": format_stock_list(gainers),
-        "top_losers": format_stock_list(losers),
-        "value_picks": format_stock_list(value_picks),
+        "best_overall": format_views(best_stocks),
+        "best_longterm": format_views(best_longterm),
+        "best_intraday": format_views(best_intraday),
+        "best_swing": format_views(best_swing),
+        "strong_buy": format_views(strong_buy),
+        "strong_sell": format_views(strong_sell),
+        "top_gainers": format_views(gainers),
+        "top_losers": format_views(losers),
+        "value_picks": format_views(value_picks),
         "sector_analysis": sector_performance
     }
 
@@ -336,34 +491,36 @@ def analyze_sector_performance(stocks: List[Dict]) -> Dict:
     Analyze performance by sector
     Shows which sectors are bullish/bearish
     """
-    sector_data = {}
-
-    for stock in stocks:
-        ticker = stock.get('ticker')
-        sector = get_sector(ticker)
-
-        if sector not in sector_data:
-            sector_data[sector] = {
-                "stocks": [],
-                "scores": [],
-                "volumes": [],
-                "sentiment": []
-            }
-
-        overall_score = stock.get('overall_signal', {}).get('score', 50)
-        volume_ratio = stock.get('key_indicators', {}).get('volume_ratio', 1.0)
-
-        sector_data[sector]["stocks"].append(ticker)
-        sector_data[sector]["scores"].append(overall_score)
-        sector_data[sector]["volumes"].append(volume_ratio)
-
-    # Calculate sector metrics
+    n = len(stocks)
+    tickers = [stock.get('ticker') for stock in stocks]
+    ids = np.fromiter((_TICKER_SECTOR_ID.get(t, _OTHER_SECTOR_ID) for t in tickers), dtype=np.intp, count=n)
+    scores = np.fromiter(
+        (stock.get('overall_signal', {}).get('score', 50) for stock in stocks), dtype=np.float64, count=n
+    )
+    volumes = np.fromiter(
+        (stock.get('key_indicators', {}).get('volume_ratio', 1.0) for stock in stocks), dtype=np.float64, count=n
+    )
+
+    # Per-sector sums in one pass each
+    counts = np.bincount(ids, minlength=len(SECTOR_NAMES))
+    score_sums = np.bincount(ids, weights=scores, minlength=len(SECTOR_NAMES))
+    volume_sums = np.bincount(ids, weights=volumes, minlength=len(SECTOR_NAMES))
+
+    # Tickers per sector, in first-seen order
+    sector_stocks = defaultdict(list)
+    for ticker, sector_id in zip(tickers, ids.tolist()):
+        sector_stocks[sector_id].append(ticker)
+
+    # Calculate sector metrics, bucketing by trend and tracking best/worst as we go
     sector_summary = []
+    trend_buckets = {"BULLISH": [], "NEUTRAL": [], "BEARISH": []}
+    top_sector = None
+    worst_sector = None
 
-    for sector, data in sector_data.items():
-        avg_score = sum(data["scores"]) / len(data["scores"])
-        avg_volume = sum(data["volumes"]) / len(data["volumes"])
-        stock_count = len(data["stocks"])
+    for sector_id, sector_tickers in sector_stocks.items():
+        stock_count = int(counts[sector_id])
+        avg_score = float(score_sums[sector_id] / stock_count)
+        avg_volume = float(volume_sums[sector_id] / stock_count)
 
         # Determine sector trend
         if avg_score >= 60:
@@ -384,69 +541,89 @@ def analyze_sector_performance(stocks: List[Dict]) -> Dict:
         else:
             volume_strength = "LOW"
 
-        sector_summary.append({
-            "sector": sector,
+        summary = {
+            "sector": SECTOR_NAMES[sector_id],
             "trend": trend,
             "emoji": emoji,
             "avg_score": round(avg_score, 2),
             "avg_volume": round(avg_volume, 2),
             "volume_strength": volume_strength,
             "stock_count": stock_count,
-            "stocks": data["stocks"]
-        })
+            "stocks": sector_tickers
+        }
+        sector_summary.append(summary)
+        trend_buckets[trend].append(summary)
+
+        # Ties keep the same picks as sorting: first-seen best, last-seen worst
+        if top_sector is None or summary["avg_score"] > top_sector["avg_score"]:
+            top_sector = summary
+        if worst_sector is None or summary["avg_score"] <= worst_sector["avg_score"]:
+            worst_sector = summary
 
     # Sort by average score (best sectors first)
     sector_summary.sort(key=lambda x: x["avg_score"], reverse=True)
+    trend_buckets["BULLISH"].sort(key=lambda x: x["avg_score"], reverse=True)
+    trend_buckets["BEARISH"].sort(key=lambda x: x["avg_score"], reverse=True)
 
     return {
         "sectors": sector_summary,
-        "bullish_sectors": [s for s in sector_summary if s["trend"] == "BULLISH"],
-        "bearish_sectors": [s for s in sector_summary if s["trend"] == "BEARISH"],
-        "top_sector": sector_summary[0] if sector_summary else None,
-        "worst_sector": sector_summary[-1] if sector_summary else None
+        "bullish_sectors": trend_buckets["BULLISH"],
+        "bearish_sectors": trend_buckets["BEARISH"],
+        "top_sector": top_sector,
+        "worst_sector": worst_sector
+    }
+
+def format_stock(s: Dict) -> Dict:
+    """Format one stock's signals for display"""
+    # Look each nested section up once instead of once per field
+    ticker = s.get('ticker')
+    overall = s.get('overall_signal', {})
+    key_indicators = s.get('key_indicators', {})
+    timeframes = s.get('timeframe_signals', {})
+    conflicts = s.get('signal_conflicts', {})
+    risk = s.get('risk_management', {})
+
+    return {
+        "ticker": ticker,
+        "sector": get_sector(ticker),
+        "current_price": s.get('current_price'),
+        "overall_signal": overall.get('signal'),
+        "overall_score": overall.get('score'),
+        "signal_strength": overall.get('strength', 'Unknown'),
+        "confidence_level": s.get('confidence_level', 'Unknown'),
+        "technical_score": s.get('technical_analysis', {}).get('score'),
+        "fundamental_score": s.get('fundamental_analysis', {}).get('score'),
+        "rsi": key_indicators.get('rsi'),
+        "macd_histogram": key_indicators.get('macd_histogram'),
+        "volume_ratio": key_indicators.get('volume_ratio'),
+        "intraday_signal": timeframes.get('intraday', {}).get('signal'),
+        "swing_signal": timeframes.get('swing', {}).get('signal'),
+        "longterm_signal": timeframes.get('long_term', {}).get('signal'),
+        "vwap_score": s.get('vwap_strategy', {}).get('score'),
+        "has_conflicts": conflicts.get('has_conflicts', False),
+        "conflict_count": conflicts.get('conflict_count', 0),
+        "risk_management": {
+            "stop_loss": risk.get('stop_loss'),
+            "take_profit": risk.get('take_profit'),
+            "position_size_pct": risk.get('position_size_pct', 0)
+        },
+        "trading_recommendation": s.get('trading_recommendation', {}).get('safety_level', 'Unknown'),
+        "timestamp": s.get('timestamp')
     }
 
 def format_stock_list(stocks: List[Dict]) -> List[Dict]:
     """Format stock data for display with sector and enhanced info"""
-    return [
-        {
-            "ticker": s.get('ticker'),
-            "sector": get_sector(s.get('ticker')),
-            "current_price": s.get('current_price'),
-            "overall_signal": s.get('overall_signal', {}).get('signal'),
-            "overall_score": s.get('overall_signal', {}).get('score'),
-            "signal_strength": s.get('overall_signal', {}).get('strength', 'Unknown'),
-            "confidence_level": s.get('confidence_level', 'Unknown'),
-            "technical_score": s.get('technical_analysis', {}).get('score'),
-            "fundamental_score": s.get('fundamental_analysis', {}).get('score'),
-            "rsi": s.get('key_indicators', {}).get('rsi'),
-            "macd_histogram": s.get('key_indicators', {}).get('macd_histogram'),
-            "volume_ratio": s.get('key_indicators', {}).get('volume_ratio'),
-            "intraday_signal": s.get('timeframe_signals', {}).get('intraday', {}).get('signal'),
-            "swing_signal": s.get('timeframe_signals', {}).get('swing', {}).get('signal'),
-            "longterm_signal": s.get('timeframe_signals', {}).get('long_term', {}).get('signal'),
-            "vwap_score": s.get('vwap_strategy', {}).get('score'),
-            "has_conflicts": s.get('signal_conflicts', {}).get('has_conflicts', False),
-            "conflict_count": s.get('signal_conflicts', {}).get('conflict_count', 0),
-            "risk_management": {
-                "stop_loss": s.get('risk_management', {}).get('stop_loss'),
-                "take_profit": s.get('risk_management', {}).get('take_profit'),
-                "position_size_pct": s.get('risk_management', {}).get('position_size_pct', 0)
-            },
-            "trading_recommendation": s.get('trading_recommendation', {}).get('safety_level', 'Unknown'),
-            "timestamp": s.get('timestamp')
-        }
-        for s in stocks
-    ]
+    return [format_stock(s) for s in stocks]
 
 def get_stock_comparison(tickers: List[str]) -> Dict:
     """Compare multiple stocks side by side"""
-    results = []
+    if not tickers:
+        return {"comparison": [], "count": 0}
 
-    for ticker in tickers:
-        signals = get_stock_signals_cached(ticker)
-        if 'error' not in signals:
-            results.append(signals)
+    # Fetch in parallel; the shared rate limiter still paces the requests
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(tickers))) as executor:
+        fetched = list(executor.map(get_stock_signals_cached, tickers))
+    results = [signals for signals in fetched if 'error' not in signals]
 
     return {
         "comparison": format_stock_list(results),
@@ -456,8 +633,7 @@ def get_stock_comparison(tickers: List[str]) -> Dict:
 def clear_cache():
     """Clear all cached data"""
     try:
-        for cache_file in CACHE_DIR.glob("*.json"):
-            cache_file.unlink()
+        stock_cache.clear()
         return {"message": "Cache cleared successfully"}
     except Exception as e:
         return {"error": f"Failed to clear cache: {str(e)}"}
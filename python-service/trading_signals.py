@@ -3,237 +3,461 @@ Fixed Trading Signals - All calculation errors corrected
 Based on verified formulas from industry standards (2025)
 """
 
+import math
+import threading
+from bisect import bisect_right
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+import requests
+from cachetools import TTLCache
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enhanced_signals import enhance_trading_signals
+from indicator_kernels import directional_index, ewm_alpha, wilder_averages
 from sentiment import get_real_sentiment_score
 
-def calculate_rsi_wilder(prices: pd.Series, period: int = 14) -> float:
+# yfinance info/history for recently analyzed tickers; dashboards re-request the same symbols
+# and the network round trips dwarf the indicator math
+TICKER_CACHE_TTL = 300  # seconds
+_ticker_cache = TTLCache(maxsize=512, ttl=TICKER_CACHE_TTL)
+_ticker_cache_lock = threading.Lock()
+
+# HTTP statuses worth retrying: throttling and server hiccups
+TRANSIENT_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Background threads for the independent network calls of one analysis (info, sentiment);
+# sized for analyze_many's workers each having both in flight
+FETCH_WORKERS = 32
+_fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="signals-fetch")
+
+
+def is_transient_error(e: Exception) -> bool:
+    """Errors worth retrying: throttling, server hiccups, dropped connections, timeouts"""
+    if isinstance(e, requests.HTTPError):
+        return e.response is not None and e.response.status_code in TRANSIENT_STATUS_CODES
+    if isinstance(e, (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)):
+        return True
+    # Newer yfinance raises its own rate-limit error
+    return type(e).__name__ == "YFRateLimitError"
+
+
+def _fetch_ticker(ticker: str, with_history: bool = True) -> Tuple[Dict, Optional[pd.DataFrame]]:
     """
-    Calculate RSI using Wilder's Smoothing Method (Vectorized)
+    (info, 1-year daily history) for ticker, served from a short TTL cache
+    with_history=False skips the history download when the caller already has prices
     """
-    delta = prices.diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
+    with _ticker_cache_lock:
+        cached = _ticker_cache.get(ticker)
+    if cached is not None and (cached[1] is not None or not with_history):
+        return cached
+
+    if cached is not None:
+        info = cached[0]
+        history = yf.Ticker(ticker).history(period="1y")
+    elif with_history:
+        # info and history are separate requests; download both at once
+        info_future = _fetch_executor.submit(lambda: yf.Ticker(ticker).info)
+        history = yf.Ticker(ticker).history(period="1y")
+        info = info_future.result()
+    else:
+        info = yf.Ticker(ticker).info
+        history = None
 
-    # Use EWM with com=period-1 for Wilder's smoothing
-    avg_gain = gain.ewm(com=period-1, min_periods=period, adjust=False).mean()
-    avg_loss = loss.ewm(com=period-1, min_periods=period, adjust=False).mean()
+    # Don't pin an empty download for the whole TTL
+    if history is not None and history.empty:
+        return info, history
+
+    with _ticker_cache_lock:
+        _ticker_cache[ticker] = (info, history)
+    return info, history
+
+
+# OHLCV columns pulled out of the DataFrame once and shared by every indicator
+PriceArrays = namedtuple('PriceArrays', 'open high low close volume')
+
+
+def price_arrays(df: pd.DataFrame) -> PriceArrays:
+    """
+    Extract OHLCV as contiguous float64 arrays
+    float64 columns come back as zero-copy views of the frame's block (read-only under
+    copy-on-write, so indicators must not write into them); only an integer Volume is converted
+    """
+    return PriceArrays(*(
+        np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+        for col in ('Open', 'High', 'Low', 'Close', 'Volume')
+    ))
+
+
+def tail_arrays(arrays: PriceArrays, n: int) -> PriceArrays:
+    """Last n rows of every column (views, no copies)"""
+    return PriceArrays(*(a[-n:] for a in arrays))
+
+
+def ema(values: np.ndarray, span: Optional[int] = None, alpha: Optional[float] = None) -> np.ndarray:
+    """Exponential moving average with adjust=False (span-N: alpha = 2 / (N + 1))"""
+    if alpha is None:
+        alpha = 2 / (span + 1)
+    return ewm_alpha(values, alpha)
 
-    # Calculate RS and RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+
+def last_mean(values: np.ndarray, window: int) -> float:
+    """Mean of the last `window` values (the final point of a rolling mean), NaN if too short"""
+    if len(values) < window:
+        return np.nan
+    return float(values[-window:].mean())
+
+
+def trailing_rolling(values: np.ndarray, window: int, count: int, func=np.mean) -> np.ndarray:
+    """
+    func over each of the last `count` rolling windows (the tail of a rolling series)
+    Positions without a full window are NaN, like pandas' rolling with min_periods=window
+    """
+    out = np.full(count, np.nan)
+    available = min(count, len(values) - window + 1)
+    if available > 0:
+        out[count - available:] = func(sliding_window_view(values[-(window + available - 1):], window), axis=1)
+    return out
+
+
+# ATR reads the last 14 true ranges and ADX the last 27 (14 DX values of 14-bar means)
+TRUE_RANGE_BARS = 27
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+               bars: Optional[int] = None) -> np.ndarray:
+    """
+    True range per bar; the first bar has no previous close so it is just High - Low
+    bars: only compute the last `bars` values (everything callers read)
+    """
+    if bars is not None and len(close) > bars:
+        # Keep one extra bar so the first kept bar still sees its previous close
+        high, low, close = high[-bars - 1:], low[-bars - 1:], close[-bars - 1:]
+        prev_close = close[:-1]
+        high, low = high[1:], low[1:]
+    else:
+        prev_close = np.empty_like(close)
+        prev_close[0] = np.nan
+        prev_close[1:] = close[:-1]
+    # Nested fmax, no stacked (3, n) temporary; fmax also skips the NaN previous close on the first bar
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def calculate_rsi_wilder(prices: np.ndarray, period: int = 14) -> float:
+    """
+    Calculate RSI using Wilder's Smoothing Method (Vectorized)
+    """
+    if len(prices) < period:
+        return 50.0  # Neutral until there is a full period of data
+
+    # Wilder's smoothing is an EMA with alpha = 1/period over the gain/loss split
+    avg_gain, avg_loss = wilder_averages(prices, period)
 
     # Handle edge cases
-    if pd.isna(rsi.iloc[-1]):
+    if math.isnan(avg_gain) or math.isnan(avg_loss):
         return 50.0  # Neutral if calculation fails
-    if avg_loss.iloc[-1] == 0:
-        return 100.0  # Overbought if no losses
+    if avg_loss == 0:
+        return 50.0 if avg_gain == 0 else 100.0  # Flat: neutral; no losses: overbought
 
-    return float(rsi.iloc[-1])
+    # Calculate RS and RSI
+    rs = avg_gain / avg_loss
+    return float(100 - (100 / (1 + rs)))
 
 
-def calculate_rsi(prices: pd.Series, period: int = 14) -> float:
+def calculate_rsi(prices: np.ndarray, period: int = 14) -> float:
     """Wrapper for RSI calculation - uses Wilder's method"""
     return calculate_rsi_wilder(prices, period)
 
 
-def calculate_atr(df: pd.DataFrame, period: int = 14) -> float:
+def calculate_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14,
+                  tr: Optional[np.ndarray] = None) -> float:
     """Calculate Average True Range for volatility measurement"""
-    if len(df) < period:
+    if len(close) < period:
         return 1.0  # Default fallback for insufficient data
 
-    high = df['High']
-    low = df['Low']
-    close = df['Close']
+    if tr is None:
+        tr = true_range(high, low, close, bars=period)
+    atr = last_mean(tr, period)
 
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = tr.rolling(window=period).mean()
-
-    if pd.isna(atr.iloc[-1]):
+    if math.isnan(atr):
         return 1.0  # Fallback if calculation fails
 
-    return float(atr.iloc[-1])
+    return atr
 
 
-def calculate_macd(prices: pd.Series) -> Dict:
+def calculate_macd(prices: np.ndarray, ema12: Optional[np.ndarray] = None,
+                   ema26: Optional[np.ndarray] = None) -> Dict:
     """
     Calculate MACD indicator (Correct Formula)
     MACD Line = 12-EMA - 26-EMA
     Signal Line = 9-EMA of MACD Line
     Histogram = MACD Line - Signal Line
+    ema12/ema26: precomputed EMAs of prices, if the caller already has them
     """
     # Calculate EMAs
-    ema12 = prices.ewm(span=12, adjust=False).mean()
-    ema26 = prices.ewm(span=26, adjust=False).mean()
+    if ema12 is None:
+        ema12 = ema(prices, span=12)
+    if ema26 is None:
+        ema26 = ema(prices, span=26)
 
     # Calculate MACD line
     macd_line = ema12 - ema26
 
     # Calculate Signal line (9-period EMA of MACD)
-    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    signal_line = ema(macd_line, span=9)
 
     # Calculate Histogram (MACD - Signal)
     histogram = macd_line - signal_line
 
     return {
-        "macd": float(macd_line.iloc[-1]),
-        "signal": float(signal_line.iloc[-1]),
-        "histogram": float(histogram.iloc[-1])
+        "macd": float(macd_line[-1]),
+        "signal": float(signal_line[-1]),
+        "histogram": float(histogram[-1])
     }
 
 
-def calculate_bollinger_bands(prices: pd.Series, period: int = 20) -> Dict:
+def calculate_bollinger_bands(prices: np.ndarray, period: int = 20) -> Dict:
     """Calculate Bollinger Bands"""
-    sma = prices.rolling(window=period).mean()
-    std = prices.rolling(window=period).std()
+    # Only the latest band is reported, so only the last window is needed
+    if len(prices) >= period:
+        window = prices[-period:]
+        sma = window.mean()
+        std = window.std(ddof=1)
+    else:
+        sma = std = np.nan
     upper = sma + (std * 2)
     lower = sma - (std * 2)
 
-    current_price = prices.iloc[-1]
-    band_width = ((upper.iloc[-1] - lower.iloc[-1]) / sma.iloc[-1]) * 100
+    current_price = prices[-1]
+    band_range = upper - lower
+    band_width = (band_range / sma) * 100 if sma != 0 else 0.0
+
+    # A flat window has zero-width bands: treat price as mid-band rather than dividing by zero.
+    # Outside the bands the position is clipped to [0, 1] (NaN still passes through)
+    if band_range < 1e-12:
+        price_position = 0.5
+    else:
+        price_position = min(max(float((current_price - lower) / band_range), 0.0), 1.0)
 
     return {
-        "upper": float(upper.iloc[-1]),
-        "middle": float(sma.iloc[-1]),
-        "lower": float(lower.iloc[-1]),
+        "upper": float(upper),
+        "middle": float(sma),
+        "lower": float(lower),
         "band_width": float(band_width),
-        "price_position": (current_price - lower.iloc[-1]) / (upper.iloc[-1] - lower.iloc[-1])
+        "price_position": price_position
     }
 
 
-def calculate_moving_averages(prices: pd.Series) -> Dict:
+def calculate_moving_averages(prices: np.ndarray, ema12: Optional[np.ndarray] = None,
+                              ema26: Optional[np.ndarray] = None) -> Dict:
     """Calculate multiple moving averages"""
+    if ema12 is None:
+        ema12 = ema(prices, span=12)
+    if ema26 is None:
+        ema26 = ema(prices, span=26)
+
     return {
-        "sma_20": float(prices.rolling(window=20).mean().iloc[-1]),
-        "sma_50": float(prices.rolling(window=50).mean().iloc[-1]),
-        "sma_200": float(prices.rolling(window=200).mean().iloc[-1]),
-        "ema_12": float(prices.ewm(span=12, adjust=False).mean().iloc[-1]),
-        "ema_26": float(prices.ewm(span=26, adjust=False).mean().iloc[-1])
+        "sma_20": last_mean(prices, 20),
+        "sma_50": last_mean(prices, 50),
+        "sma_200": last_mean(prices, 200),
+        "ema_12": float(ema12[-1]),
+        "ema_26": float(ema26[-1])
     }
 
 
-def calculate_volume_analysis(df: pd.DataFrame) -> Dict:
+def calculate_volume_analysis(close: np.ndarray, volume: np.ndarray) -> Dict:
     """
     Analyze volume patterns (Fixed volume ratio calculation)
     """
     # Use minimum of 20 or available data length
-    window = min(20, len(df))
+    window = min(20, len(volume))
 
     # Calculate average volume for the window
-    avg_volume = df['Volume'].rolling(window=window).mean().iloc[-1]
-    current_volume = df['Volume'].iloc[-1]
+    avg_volume = last_mean(volume, window)
+    current_volume = volume[-1]
 
     # Fixed: Ensure proper volume ratio calculation
-    if avg_volume > 0 and not pd.isna(avg_volume) and not pd.isna(current_volume):
+    if avg_volume > 0 and not math.isnan(avg_volume) and not math.isnan(current_volume):
         volume_ratio = current_volume / avg_volume
     else:
         volume_ratio = 1.0
 
-    # On-Balance Volume (OBV)
-    obv = (df['Volume'] * (~df['Close'].diff().le(0) * 2 - 1)).cumsum()
+    # On-Balance Volume (OBV): +volume on up days (and the first bar), -volume otherwise
+    signed_volume = volume * np.where(np.diff(close, prepend=np.nan) <= 0, -1.0, 1.0)
 
     # Calculate OBV trend using available data
-    if len(obv) >= window:
-        obv_trend = (obv.iloc[-1] - obv.iloc[-window]) / obv.iloc[-window] * 100 if obv.iloc[-window] != 0 else 0
+    # Only OBV `window` bars ago and its change since are needed, so sum those two spans
+    # instead of building the running total (a NaN bar at either end makes that OBV NaN)
+    if len(signed_volume) >= window:
+        start = len(signed_volume) - window
+        obv_then = np.nansum(signed_volume[:start + 1]) if not math.isnan(signed_volume[start]) else np.nan
+        obv_change = np.nansum(signed_volume[start + 1:]) if not math.isnan(signed_volume[-1]) else np.nan
+        obv_trend = obv_change / obv_then * 100 if obv_then != 0 else 0
     else:
         obv_trend = 0  # Not enough data for trend
 
     return {
         "current_volume": int(current_volume),
-        "avg_volume_20": float(avg_volume) if not pd.isna(avg_volume) else 0.0,
+        "avg_volume_20": float(avg_volume) if not math.isnan(avg_volume) else 0.0,
         "volume_ratio": float(volume_ratio),
         "obv_trend": float(obv_trend)
     }
 
 
-def calculate_momentum_indicators(df: pd.DataFrame) -> Dict:
-    """Calculate momentum indicators"""
+def calculate_momentum_indicators(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                                  tr: Optional[np.ndarray] = None) -> Dict:
+    """
+    Calculate momentum indicators
+    tr: precomputed true range (shared with calculate_atr)
+    """
     # Rate of Change (ROC)
-    roc_10 = ((df['Close'].iloc[-1] - df['Close'].iloc[-10]) / df['Close'].iloc[-10]) * 100
-
-    # Stochastic Oscillator
-    low_14 = df['Low'].rolling(window=14).min()
-    high_14 = df['High'].rolling(window=14).max()
-    k_percent = 100 * ((df['Close'] - low_14) / (high_14 - low_14))
-    d_percent = k_percent.rolling(window=3).mean()
-
-    # ADX (Average Directional Index) - simplified
-    high_diff = df['High'].diff()
-    low_diff = -df['Low'].diff()
-    plus_dm = high_diff.where((high_diff > low_diff) & (high_diff > 0), 0)
-    minus_dm = low_diff.where((low_diff > high_diff) & (low_diff > 0), 0)
-    atr = df['High'].subtract(df['Low']).rolling(window=14).mean()
-    plus_di = 100 * (plus_dm.rolling(window=14).mean() / atr)
-    minus_di = 100 * (minus_dm.rolling(window=14).mean() / atr)
-    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-    adx = dx.rolling(window=14).mean()
+    roc_10 = ((close[-1] - close[-10]) / close[-10]) * 100
+
+    # Only the final values are reported, so work on the shortest tails that produce them
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Stochastic Oscillator: %K for the last 3 bars, %D is their mean
+        low_14 = trailing_rolling(low, 14, 3, np.min)
+        high_14 = trailing_rolling(high, 14, 3, np.max)
+        k_percent = 100 * ((close[-3:] - low_14) / (high_14 - low_14))
+        d_percent = k_percent.mean()
+
+    # ADX (Average Directional Index) - simplified, DI smoothed over the true range
+    # ADX averages the last 14 DX values, each from 14-bar DI means: 27 bars of moves
+    if tr is None:
+        tr = true_range(high, low, close, bars=TRUE_RANGE_BARS)
+    _, _, adx = directional_index(high, low, tr, 14)
 
     return {
         "roc_10": float(roc_10),
-        "stochastic_k": float(k_percent.iloc[-1]),
-        "stochastic_d": float(d_percent.iloc[-1]),
-        "adx": float(adx.iloc[-1]) if not pd.isna(adx.iloc[-1]) else 25.0
+        "stochastic_k": float(k_percent[-1]),
+        "stochastic_d": float(d_percent),
+        "adx": float(adx) if not math.isnan(adx) else 25.0
     }
 
 
+@dataclass(slots=True)
+class Indicators:
+    """Full-history indicator values for one ticker, flattened for attribute access"""
+    rsi: float
+    macd: float
+    macd_signal: float
+    macd_histogram: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    bb_band_width: float
+    bb_price_position: float
+    sma_20: float
+    sma_50: float
+    sma_200: float
+    ema_12: float
+    ema_26: float
+    volume_ratio: float
+    obv_trend: float
+    roc_10: float
+    stochastic_k: float
+    stochastic_d: float
+    adx: float
+    atr: float
+
+
+def calculate_indicators(arrays: PriceArrays) -> Indicators:
+    """
+    All indicators over the full history
+    EMA-12/26 and the true range are computed once and shared between indicators
+    """
+    close = arrays.close
+    ema12 = ema(close, span=12)
+    ema26 = ema(close, span=26)
+    tr = true_range(arrays.high, arrays.low, close, bars=TRUE_RANGE_BARS)
+
+    macd = calculate_macd(close, ema12=ema12, ema26=ema26)
+    bb = calculate_bollinger_bands(close)
+    ma = calculate_moving_averages(close, ema12=ema12, ema26=ema26)
+    volume = calculate_volume_analysis(close, arrays.volume)
+    momentum = calculate_momentum_indicators(arrays.high, arrays.low, close, tr=tr)
+
+    return Indicators(
+        rsi=calculate_rsi(close),
+        macd=macd['macd'],
+        macd_signal=macd['signal'],
+        macd_histogram=macd['histogram'],
+        bb_upper=bb['upper'],
+        bb_middle=bb['middle'],
+        bb_lower=bb['lower'],
+        bb_band_width=bb['band_width'],
+        bb_price_position=bb['price_position'],
+        sma_20=ma['sma_20'],
+        sma_50=ma['sma_50'],
+        sma_200=ma['sma_200'],
+        ema_12=ma['ema_12'],
+        ema_26=ma['ema_26'],
+        volume_ratio=volume['volume_ratio'],
+        obv_trend=volume['obv_trend'],
+        roc_10=momentum['roc_10'],
+        stochastic_k=momentum['stochastic_k'],
+        stochastic_d=momentum['stochastic_d'],
+        adx=momentum['adx'],
+        atr=calculate_atr(arrays.high, arrays.low, close, tr=tr)
+    )
+
+
 # Import remaining functions from vwap_strategy
 from vwap_strategy import calculate_vwap_strategy_score
 
 
-def calculate_technical_score(indicators: Dict, current_price: float) -> Dict:
-    """Calculate technical analysis score (0-100) with trend context"""
-    signals = []
+# Score ladders as (ascending bounds, score per band): value < bounds[0] scores scores[0], ...
+# "value > bound" ladders are looked up on -value against negated bounds
+RSI_BOUNDS = (30, 40, 60, 70)
+RSI_SCORES_TRENDING = (90, 70, 50, 30, None)  # overbought in a trend depends on the MAs
+RSI_SCORES_RANGING = (100, 75, 50, 25, 0)
+BB_POSITION_BOUNDS = (0.2, 0.4, 0.6, 0.8)
+BB_POSITION_SCORES = (100, 75, 50, 25, 0)
+VOLUME_RATIO_BOUNDS = (-1.5, -1.2, -0.8)
+VOLUME_RATIO_SCORES = (100, 75, 50, 25)
+ROC_BOUNDS = (-5, -2)
+ROC_RISE_BONUS = (50, 25, 0)
+ROC_DROP_PENALTY = (-50, -25, 0)
+
+
+# Technical signals in scoring order and their weights (percent)
+TECHNICAL_SIGNAL_NAMES = ("RSI", "MACD", "Bollinger Bands", "Moving Averages", "Volume", "Momentum")
+TECHNICAL_WEIGHT_LIST = (20, 20, 15, 15, 10, 20)
+TECHNICAL_WEIGHTS = np.array(TECHNICAL_WEIGHT_LIST)
+TECHNICAL_WEIGHT_TOTAL = sum(TECHNICAL_WEIGHT_LIST)
+
+
+def band_score(value: float, bounds: Tuple, scores: Tuple):
+    """
+    Score of the band value falls in: scores[i] for bounds[i-1] <= value < bounds[i]
+    NaN compares false against every bound and lands in the last band, like an if/elif ladder's else
+    """
+    return scores[bisect_right(bounds, value)]
+
 
+def calculate_technical_score(indicators: Indicators, current_price: float) -> Dict:
+    """Calculate technical analysis score (0-100) with trend context"""
     # Get trend strength from ADX
-    adx = indicators['momentum']['adx']
+    adx = indicators.adx
     is_trending = adx > 25  # Strong trend when ADX > 25
-    ma = indicators['moving_averages']
 
     # RSI Signal with ADX Context (weight: 20%)
-    rsi = indicators['rsi']
-    if is_trending:
-        if rsi < 30:
-            rsi_score = 90
-        elif rsi < 40:
-            rsi_score = 70
-        elif rsi < 60:
-            rsi_score = 50
-        elif rsi < 70:
-            rsi_score = 30
-        else:
-            if current_price > ma['sma_50'] and current_price > ma['sma_200']:
-                rsi_score = 40
-            else:
-                rsi_score = 10
-    else:
-        if rsi < 30:
-            rsi_score = 100
-        elif rsi < 40:
-            rsi_score = 75
-        elif rsi < 60:
-            rsi_score = 50
-        elif rsi < 70:
-            rsi_score = 25
-        else:
-            rsi_score = 0
-    signals.append({"name": "RSI", "score": rsi_score, "weight": 20})
+    rsi = indicators.rsi
+    rsi_score = band_score(rsi, RSI_BOUNDS, RSI_SCORES_TRENDING if is_trending else RSI_SCORES_RANGING)
+    if rsi_score is None:
+        rsi_score = 40 if current_price > indicators.sma_50 and current_price > indicators.sma_200 else 10
 
     # MACD Signal with Dynamic Thresholds (weight: 20%)
-    macd_data = indicators['macd']
-    atr = indicators.get('atr', 1.0)
+    atr = indicators.atr
     dynamic_threshold = max(current_price * 0.001, atr * 0.1)
 
-    histogram = macd_data['histogram']
-    macd_line = macd_data['macd']
-    signal_line = macd_data['signal']
+    histogram = indicators.macd_histogram
+    macd_line = indicators.macd
+    signal_line = indicators.macd_signal
 
     # Score based on MACD position
     if histogram > 0 and macd_line > signal_line:
@@ -251,70 +475,44 @@ def calculate_technical_score(indicators: Dict, current_price: float) -> Dict:
     else:
         macd_score = 40
 
-    signals.append({"name": "MACD", "score": macd_score, "weight": 20})
 
     # Bollinger Bands Signal
-    bb = indicators['bollinger_bands']
-    price_pos = bb['price_position']
-    if price_pos < 0.2:
-        bb_score = 100
-    elif price_pos < 0.4:
-        bb_score = 75
-    elif price_pos < 0.6:
-        bb_score = 50
-    elif price_pos < 0.8:
-        bb_score = 25
-    else:
-        bb_score = 0
-    signals.append({"name": "Bollinger Bands", "score": bb_score, "weight": 15})
+    bb_score = band_score(indicators.bb_price_position, BB_POSITION_BOUNDS, BB_POSITION_SCORES)
 
     # Moving Average Signal
-    ma = indicators['moving_averages']
     ma_score = 0
-    if current_price > ma['sma_20']:
+    if current_price > indicators.sma_20:
         ma_score += 25
-    if current_price > ma['sma_50']:
+    if current_price > indicators.sma_50:
         ma_score += 25
-    if current_price > ma['sma_200']:
+    if current_price > indicators.sma_200:
         ma_score += 25
-    if ma['sma_20'] > ma['sma_50'] > ma['sma_200']:
+    if indicators.sma_20 > indicators.sma_50 > indicators.sma_200:
         ma_score += 25
-    signals.append({"name": "Moving Averages", "score": ma_score, "weight": 15})
 
     # Volume Signal
-    volume = indicators['volume']
-    if volume['volume_ratio'] > 1.5 and volume['obv_trend'] > 0:
-        volume_score = 100
-    elif volume['volume_ratio'] > 1.2:
-        volume_score = 75
-    elif volume['volume_ratio'] > 0.8:
-        volume_score = 50
-    else:
-        volume_score = 25
-    signals.append({"name": "Volume", "score": volume_score, "weight": 10})
+    volume_score = band_score(-indicators.volume_ratio, VOLUME_RATIO_BOUNDS, VOLUME_RATIO_SCORES)
+    if volume_score == 100 and not indicators.obv_trend > 0:
+        volume_score = 75  # High volume only counts fully when OBV confirms accumulation
 
     # Momentum Signal
-    momentum = indicators['momentum']
-    momentum_score = 50
-    if momentum['roc_10'] > 5:
-        momentum_score = 100
-    elif momentum['roc_10'] > 2:
-        momentum_score = 75
-    elif momentum['roc_10'] < -5:
-        momentum_score = 0
-    elif momentum['roc_10'] < -2:
-        momentum_score = 25
-
-    if momentum['stochastic_k'] < 20:
+    roc = indicators.roc_10
+    momentum_score = (50 + band_score(-roc, ROC_BOUNDS, ROC_RISE_BONUS)
+                      + band_score(roc, ROC_BOUNDS, ROC_DROP_PENALTY))
+
+    if indicators.stochastic_k < 20:
         momentum_score = min(100, momentum_score + 20)
-    elif momentum['stochastic_k'] > 80:
+    elif indicators.stochastic_k > 80:
         momentum_score = max(0, momentum_score - 20)
 
-    signals.append({"name": "Momentum", "score": momentum_score, "weight": 20})
 
     # Calculate weighted score
-    total_weight = sum(s['weight'] for s in signals)
-    weighted_score = sum(s['score'] * s['weight'] for s in signals) / total_weight
+    scores = (rsi_score, macd_score, bb_score, ma_score, volume_score, momentum_score)
+    weighted_score = float(np.dot(scores, TECHNICAL_WEIGHTS)) / TECHNICAL_WEIGHT_TOTAL
+    signals = [
+        {"name": name, "score": score, "weight": weight}
+        for name, score, weight in zip(TECHNICAL_SIGNAL_NAMES, scores, TECHNICAL_WEIGHT_LIST)
+    ]
 
     return {
         "score": round(weighted_score, 2),
@@ -367,15 +565,28 @@ def get_overall_signal(technical_score: float, fundamental_score: float, sentime
     }
 
 
-def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
-    """Generate signals for different timeframes"""
+def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict,
+                          arrays: Optional[PriceArrays] = None,
+                          indicators: Optional[Indicators] = None) -> Dict:
+    """
+    Generate signals for different timeframes
+    arrays: price_arrays(df), if the caller already extracted them
+    indicators: calculate_indicators(arrays), if the caller already computed them
+
+    Swing and long-term read the full-history indicators (swing RSI-14/MACD get their full
+    warm-up that way); the 5-bar intraday view and the swing volume window use their own tails.
+    """
+    if arrays is None:
+        arrays = price_arrays(df)
+    if indicators is None:
+        indicators = calculate_indicators(arrays)
 
     # Intraday (Short-term): Last 5 days, focus on quick moves with volume
-    intraday_df = df.tail(5)
-    if len(intraday_df) >= 5:
-        intraday_rsi = calculate_rsi(intraday_df['Close'], period=5)
-        intraday_macd = calculate_macd(intraday_df['Close'])
-        intraday_volume = calculate_volume_analysis(intraday_df)
+    intraday = tail_arrays(arrays, 5)
+    if len(intraday.close) >= 5:
+        intraday_rsi = calculate_rsi(intraday.close, period=5)
+        intraday_macd = calculate_macd(intraday.close)
+        intraday_volume = calculate_volume_analysis(intraday.close, intraday.volume)
         intraday_score = 50
 
         # RSI signal for quick moves
@@ -402,35 +613,32 @@ def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
         intraday_score = 50
 
     # Swing (Medium-term): Last 50 days with multi-indicator confluence
-    swing_df = df.tail(50)
-    if len(swing_df) >= 20:
-        swing_rsi = calculate_rsi(swing_df['Close'], period=14)
-        swing_macd = calculate_macd(swing_df['Close'])
-        swing_ma = calculate_moving_averages(swing_df['Close'])
-        swing_volume = calculate_volume_analysis(swing_df)
-        swing_momentum = calculate_momentum_indicators(swing_df)
-        current_price = swing_df['Close'].iloc[-1]
+    swing = tail_arrays(arrays, 50)
+    if len(swing.close) >= 20:
+        swing_rsi = indicators.rsi
+        # SMA-20/50 and the momentum block only read the last 50 bars, so the full-history values are the same
+        swing_volume = calculate_volume_analysis(swing.close, swing.volume)
+        current_price = swing.close[-1]
 
         swing_score = 50
         confirmations = 0
 
         # 1. Trend confirmation (Moving Averages)
-        if current_price > swing_ma['sma_20'] and current_price > swing_ma['sma_50']:
+        if current_price > indicators.sma_20 and current_price > indicators.sma_50:
             swing_score += 25
             confirmations += 1
-        elif current_price < swing_ma['sma_20'] and current_price < swing_ma['sma_50']:
+        elif current_price < indicators.sma_20 and current_price < indicators.sma_50:
             swing_score -= 25
             confirmations -= 1
 
         # Check for golden/death cross
-        if swing_ma['sma_20'] > swing_ma['sma_50']:
+        if indicators.sma_20 > indicators.sma_50:
             swing_score += 5
         else:
             swing_score -= 5
 
         # 2. Momentum confirmation (RSI + MACD)
-        adx = swing_momentum['adx']
-        if adx > 25:  # Strong trend
+        if indicators.adx > 25:  # Strong trend
             if 40 < swing_rsi < 70:
                 swing_score += 10
                 confirmations += 0.5
@@ -448,10 +656,10 @@ def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
                 confirmations -= 1
 
         # MACD confirmation
-        if swing_macd['histogram'] > 0 and swing_macd['macd'] > swing_macd['signal']:
+        if indicators.macd_histogram > 0 and indicators.macd > indicators.macd_signal:
             swing_score += 10
             confirmations += 0.5
-        elif swing_macd['histogram'] < 0 and swing_macd['macd'] < swing_macd['signal']:
+        elif indicators.macd_histogram < 0 and indicators.macd < indicators.macd_signal:
             swing_score -= 10
             confirmations -= 0.5
 
@@ -464,9 +672,9 @@ def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
             confirmations -= 0.5
 
         # 4. Additional momentum from Stochastic
-        if swing_momentum['stochastic_k'] < 30:
+        if indicators.stochastic_k < 30:
             swing_score += 10
-        elif swing_momentum['stochastic_k'] > 70:
+        elif indicators.stochastic_k > 70:
             swing_score -= 10
 
         if confirmations >= 2:
@@ -481,25 +689,22 @@ def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
         swing_score = 50
 
     # Long-term: Full dataset with trend confirmation
-    if len(df) >= 200:
-        long_rsi = calculate_rsi(df['Close'], period=14)
-        long_ma = calculate_moving_averages(df['Close'])
-        long_volume = calculate_volume_analysis(df)
-        current_price = df['Close'].iloc[-1]
+    if len(arrays.close) >= 200:
+        current_price = arrays.close[-1]
 
         long_score = 50
 
-        if long_ma['sma_50'] > long_ma['sma_200']:
+        if indicators.sma_50 > indicators.sma_200:
             long_score += 25
         else:
             long_score -= 25
 
-        if current_price > long_ma['sma_200']:
+        if current_price > indicators.sma_200:
             long_score += 20
         else:
             long_score -= 20
 
-        if long_volume['obv_trend'] > 0:
+        if indicators.obv_trend > 0:
             long_score += 5
         else:
             long_score -= 5
@@ -531,47 +736,51 @@ def get_timeframe_signals(ticker: str, df: pd.DataFrame, info: Dict) -> Dict:
     }
 
 
-def analyze_trading_signals(ticker: str) -> Dict:
+def analyze_trading_signals(ticker: str, df: Optional[pd.DataFrame] = None, sentiment_detail: bool = True,
+                            timestamp: Optional[str] = None, raise_transient: bool = False) -> Dict:
     """
     Comprehensive trading signal analysis
     Returns detailed signals with multiple timeframes
+
+    df: optional pre-fetched 1-year daily history (e.g. from a batched download)
+    sentiment_detail: include per-article news in sentiment_analysis (the screener only needs the score)
+    timestamp: ISO time to stamp the result with; batch callers format it once for all tickers
+    raise_transient: raise transient fetch errors (see is_transient_error) for the caller to retry,
+        instead of returning them as an error dict
     """
-    try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+    # Sentiment only needs the ticker, so its news fetch overlaps the price download and indicators
+    sentiment_future = _fetch_executor.submit(get_real_sentiment_score, ticker, detail=sentiment_detail)
 
+    try:
         # Get historical data (1 year for comprehensive analysis)
-        df = stock.history(period="1y")
+        info, history = _fetch_ticker(ticker, with_history=df is None)
+        if df is None:
+            df = history
 
         if df.empty or len(df) < 20:
+            sentiment_future.cancel()
             return {
                 "error": "Insufficient data for analysis",
                 "ticker": ticker
             }
 
-        current_price = df['Close'].iloc[-1]
+        # Pull the price columns out once; every indicator below works on these arrays
+        arrays = price_arrays(df)
+        close = arrays.close
+        current_price = close[-1]
 
         # Calculate all indicators
-        indicators = {
-            "rsi": calculate_rsi(df['Close']),
-            "macd": calculate_macd(df['Close']),
-            "bollinger_bands": calculate_bollinger_bands(df['Close']),
-            "moving_averages": calculate_moving_averages(df['Close']),
-            "volume": calculate_volume_analysis(df),
-            "momentum": calculate_momentum_indicators(df),
-            "atr": calculate_atr(df)
-        }
+        indicators = calculate_indicators(arrays)
 
         # Calculate scores
         technical_analysis = calculate_technical_score(indicators, current_price)
 
-        # Add ticker to info for sector detection
-        info_with_ticker = dict(info)
-        info_with_ticker['symbol'] = ticker
-        fundamental_analysis = calculate_fundamental_score(info_with_ticker)
+        # Add ticker to info for sector detection, on a copy: info is shared through the ticker cache
+        info = {**info, 'symbol': ticker}
+        fundamental_analysis = calculate_fundamental_score(info)
 
         # Real sentiment analysis using VADER and yfinance news
-        sentiment_data = get_real_sentiment_score(ticker)
+        sentiment_data = sentiment_future.result()
         sentiment_score = float(sentiment_data['score'] if 'score' in sentiment_data else 50)
 
         # Overall signal
@@ -582,16 +791,16 @@ def analyze_trading_signals(ticker: str) -> Dict:
         )
 
         # Timeframe-specific signals
-        timeframe_signals = get_timeframe_signals(ticker, df, info)
+        timeframe_signals = get_timeframe_signals(ticker, df, info, arrays=arrays, indicators=indicators)
 
         # VWAP + Price Action Strategy (for intraday traders)
         from vwap_strategy import calculate_vwap_strategy_score
-        vwap_strategy = calculate_vwap_strategy_score(df.tail(30), indicators, "intraday")
+        vwap_strategy = calculate_vwap_strategy_score(df.tail(30), indicators, "intraday", arrays=tail_arrays(arrays, 30))
 
         return {
             "ticker": ticker,
             "current_price": float(current_price),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "overall_signal": overall,
             "technical_analysis": technical_analysis,
             "fundamental_analysis": fundamental_analysis,
@@ -600,18 +809,45 @@ def analyze_trading_signals(ticker: str) -> Dict:
             "timeframe_signals": timeframe_signals,
             "vwap_strategy": vwap_strategy,
             "key_indicators": {
-                "rsi": round(indicators['rsi'], 2),
-                "macd_histogram": round(indicators['macd']['histogram'], 4),
-                "price_vs_sma50": "Above" if current_price > indicators['moving_averages']['sma_50'] else "Below",
-                "price_vs_sma200": "Above" if current_price > indicators['moving_averages']['sma_200'] else "Below",
-                "volume_ratio": round(indicators['volume']['volume_ratio'], 2),
-                "adx": round(indicators['momentum']['adx'], 2),
-                "atr": round(indicators['atr'], 4)
+                "rsi": round(indicators.rsi, 2),
+                "macd_histogram": round(indicators.macd_histogram, 4),
+                "price_vs_sma50": "Above" if current_price > indicators.sma_50 else "Below",
+                "price_vs_sma200": "Above" if current_price > indicators.sma_200 else "Below",
+                "volume_ratio": round(indicators.volume_ratio, 2),
+                "adx": round(indicators.adx, 2),
+                "atr": round(indicators.atr, 4)
             }
         }
 
     except Exception as e:
+        # Don't leave the news fetch queued (or let each retry add another) once the analysis failed
+        sentiment_future.cancel()
+        if raise_transient and is_transient_error(e):
+            raise
         return {
             "error": f"Error analyzing signals: {str(e)}",
             "ticker": ticker
         }
+
+
+def analyze_many(tickers: List[str], max_workers: int = 16) -> Dict[str, Dict]:
+    """
+    Analyze several tickers concurrently
+    Each analysis mostly waits on yfinance/news I/O (which releases the GIL), so threads overlap the waits
+    Returns {ticker: signals}; failed tickers map to their error dict
+    """
+    if not tickers:
+        return {}
+
+    results = {}
+    timestamp = datetime.now().isoformat()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        futures = {
+            executor.submit(analyze_trading_signals, ticker, timestamp=timestamp): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+
+    # Report in the order the caller asked for
+    return {ticker: results[ticker] for ticker in tickers if ticker in results}
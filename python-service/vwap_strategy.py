@@ -3,9 +3,27 @@ VWAP + Price Action Strategy
 Best for Intraday Trading (70-76% win rate)
 """
 
+from bisect import bisect_left, bisect_right
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Tuple
+from indicator_kernels import vwap_last
+
+
+# Price position relative to the VWAP bands, from below -2σ up to above +2σ, and its score
+# (oversold below the bands is bullish, overbought above them bearish)
+VWAP_POSITIONS = (
+    "Below -2σ (Oversold)", "Below -1σ", "Below VWAP", "Above VWAP", "Above +1σ", "Above +2σ (Overbought)"
+)
+VWAP_POSITION_SCORES = (90, 70, 40, 60, 30, 10)
+
+
+def _ohlcv_arrays(df: pd.DataFrame):
+    """
+    Open, High, Low, Close and Volume as float64 arrays
+    Column by column: each float64 column comes back as a view, where a multi-column selection copies the frame
+    """
+    return tuple(df[col].to_numpy(dtype=np.float64) for col in ('Open', 'High', 'Low', 'Close', 'Volume'))
 
 
 def calculate_vwap(df: pd.DataFrame) -> Dict:
@@ -14,187 +32,124 @@ def calculate_vwap(df: pd.DataFrame) -> Dict:
     VWAP = Cumulative(Typical Price * Volume) / Cumulative(Volume)
     Typical Price = (High + Low + Close) / 3
     """
-    # Calculate typical price
-    typical_price = (df['High'] + df['Low'] + df['Close']) / 3
+    _, high, low, close, volume = _ohlcv_arrays(df)
+    return calculate_vwap_arrays(high, low, close, volume)
 
-    # Calculate VWAP
-    cumulative_tp_volume = (typical_price * df['Volume']).cumsum()
-    cumulative_volume = df['Volume'].cumsum()
-    vwap = cumulative_tp_volume / cumulative_volume
 
-    # Calculate VWAP standard deviation bands
-    # Deviation = sqrt(Cumulative((Typical Price - VWAP)^2 * Volume) / Cumulative(Volume))
-    price_deviation = typical_price - vwap
-    cumulative_dev_volume = (price_deviation ** 2 * df['Volume']).cumsum()
-    vwap_std = np.sqrt(cumulative_dev_volume / cumulative_volume)
+def calculate_vwap_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> Dict:
+    """calculate_vwap on float64 High, Low, Close and Volume arrays"""
+    # VWAP and its standard deviation at the latest bar; only the latest bands are reported
+    current_vwap, vwap_std = vwap_last(high, low, close, volume)
+
+    current_price = close[-1]
 
     # Standard deviation bands (1σ, 2σ, 3σ)
-    vwap_upper_1 = vwap + vwap_std
-    vwap_lower_1 = vwap - vwap_std
-    vwap_upper_2 = vwap + (2 * vwap_std)
-    vwap_lower_2 = vwap - (2 * vwap_std)
-    vwap_upper_3 = vwap + (3 * vwap_std)
-    vwap_lower_3 = vwap - (3 * vwap_std)
-
-    current_price = df['Close'].iloc[-1]
-    current_vwap = vwap.iloc[-1]
-
-    # Determine price position relative to VWAP bands
-    if current_price > vwap_upper_2.iloc[-1]:
-        position = "Above +2σ (Overbought)"
-        position_score = 10  # Bearish
-    elif current_price > vwap_upper_1.iloc[-1]:
-        position = "Above +1σ"
-        position_score = 30  # Slightly bearish
-    elif current_price > current_vwap:
-        position = "Above VWAP"
-        position_score = 60  # Bullish
-    elif current_price > vwap_lower_1.iloc[-1]:
-        position = "Below VWAP"
-        position_score = 40  # Slightly bearish
-    elif current_price > vwap_lower_2.iloc[-1]:
-        position = "Below -1σ"
-        position_score = 70  # Bullish (oversold)
-    else:
-        position = "Below -2σ (Oversold)"
-        position_score = 90  # Strong bullish
+    vwap_upper_1 = current_vwap + vwap_std
+    vwap_lower_1 = current_vwap - vwap_std
+    vwap_upper_2 = current_vwap + (2 * vwap_std)
+    vwap_lower_2 = current_vwap - (2 * vwap_std)
+    vwap_upper_3 = current_vwap + (3 * vwap_std)
+    vwap_lower_3 = current_vwap - (3 * vwap_std)
+
+    # Determine price position relative to VWAP bands: the number of band edges price is above.
+    # Edges are ascending (std >= 0) or all NaN (no VWAP), which bisect treats as "below every edge"
+    band_index = bisect_left((vwap_lower_2, vwap_lower_1, current_vwap, vwap_upper_1, vwap_upper_2), current_price)
+    position = VWAP_POSITIONS[band_index]
+    position_score = VWAP_POSITION_SCORES[band_index]
 
     return {
         "vwap": float(current_vwap),
-        "upper_band_1": float(vwap_upper_1.iloc[-1]),
-        "lower_band_1": float(vwap_lower_1.iloc[-1]),
-        "upper_band_2": float(vwap_upper_2.iloc[-1]),
-        "lower_band_2": float(vwap_lower_2.iloc[-1]),
-        "upper_band_3": float(vwap_upper_3.iloc[-1]),
-        "lower_band_3": float(vwap_lower_3.iloc[-1]),
+        "upper_band_1": float(vwap_upper_1),
+        "lower_band_1": float(vwap_lower_1),
+        "upper_band_2": float(vwap_upper_2),
+        "lower_band_2": float(vwap_lower_2),
+        "upper_band_3": float(vwap_upper_3),
+        "lower_band_3": float(vwap_lower_3),
         "position": position,
         "position_score": position_score,
         "distance_from_vwap_percent": float(((current_price - current_vwap) / current_vwap) * 100)
     }
 
 
+# Candlestick patterns detected by detect_price_action_patterns, with signal strength (+ bullish, - bearish)
+PRICE_ACTION_PATTERNS = (
+    "Bullish Engulfing", "Bearish Engulfing", "Hammer", "Shooting Star", "Doji",
+    "Bullish Harami", "Bearish Harami", "Morning Star", "Evening Star",
+    "Three White Soldiers", "Three Black Crows"
+)
+# Weights per pattern; a Doji leans against the move it follows
+DOJI_AFTER_RISE_WEIGHTS = np.array([25, -25, 20, -20, -5, 15, -15, 30, -30, 35, -35])
+DOJI_AFTER_FALL_WEIGHTS = np.array([25, -25, 20, -20, 5, 15, -15, 30, -30, 35, -35])
+
+
 def detect_price_action_patterns(df: pd.DataFrame) -> Dict:
     """
     Detect key price action patterns (candlestick patterns)
     Returns bullish/bearish signals based on patterns
     """
-    patterns = []
-    signal_strength = 0
+    open_, high, low, close, _ = _ohlcv_arrays(df)
+    return detect_price_action_arrays(open_, high, low, close)
 
+
+def detect_price_action_arrays(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> Dict:
+    """detect_price_action_patterns on float64 Open, High, Low and Close arrays"""
     # Need at least 3 candles for pattern detection
-    if len(df) < 3:
+    if len(close) < 3:
         return {"patterns": [], "signal_strength": 0, "dominant_pattern": "INSUFFICIENT DATA"}
 
-    # Get last 3 candles
-    c1 = df.iloc[-3]  # 2 candles ago
-    c2 = df.iloc[-2]  # 1 candle ago
-    c3 = df.iloc[-1]  # Current candle
-
-    # Calculate candle bodies and shadows
-    c3_body = abs(c3['Close'] - c3['Open'])
-    c3_range = c3['High'] - c3['Low']
-    c3_upper_shadow = c3['High'] - max(c3['Close'], c3['Open'])
-    c3_lower_shadow = min(c3['Close'], c3['Open']) - c3['Low']
-
-    c2_body = abs(c2['Close'] - c2['Open'])
-    c2_range = c2['High'] - c2['Low']
-
-    c1_body = abs(c1['Close'] - c1['Open'])
-
-    # 1. BULLISH ENGULFING PATTERN (Strong Buy)
-    if (c2['Close'] < c2['Open'] and  # Previous candle is bearish
-        c3['Close'] > c3['Open'] and  # Current candle is bullish
-        c3['Open'] < c2['Close'] and  # Opens below previous close
-        c3['Close'] > c2['Open']):    # Closes above previous open
-        patterns.append("Bullish Engulfing")
-        signal_strength += 25
-
-    # 2. BEARISH ENGULFING PATTERN (Strong Sell)
-    if (c2['Close'] > c2['Open'] and  # Previous candle is bullish
-        c3['Close'] < c3['Open'] and  # Current candle is bearish
-        c3['Open'] > c2['Close'] and  # Opens above previous close
-        c3['Close'] < c2['Open']):    # Closes below previous open
-        patterns.append("Bearish Engulfing")
-        signal_strength -= 25
-
-    # 3. HAMMER (Bullish Reversal)
-    if (c3_lower_shadow > 2 * c3_body and  # Long lower shadow
-        c3_upper_shadow < c3_body * 0.3 and  # Small upper shadow
-        c3_body > 0):  # Has a body
-        patterns.append("Hammer")
-        signal_strength += 20
-
-    # 4. SHOOTING STAR (Bearish Reversal)
-    if (c3_upper_shadow > 2 * c3_body and  # Long upper shadow
-        c3_lower_shadow < c3_body * 0.3 and  # Small lower shadow
-        c3_body > 0):  # Has a body
-        patterns.append("Shooting Star")
-        signal_strength -= 20
-
-    # 5. DOJI (Indecision - Neutral but important)
-    if c3_range > 0 and c3_body < c3_range * 0.1:  # Very small body
-        patterns.append("Doji")
-        # Doji after uptrend = bearish, after downtrend = bullish
-        if c3['Close'] > c2['Close']:
-            signal_strength -= 5
-        else:
-            signal_strength += 5
-
-    # 6. BULLISH HARAMI (Moderate Buy)
-    if (c2_body > c3_body and  # Previous candle has larger body
-        c2['Close'] < c2['Open'] and  # Previous candle is bearish
-        c3['Close'] > c3['Open'] and  # Current candle is bullish
-        c3['Open'] > c2['Close'] and  # Opens above previous close
-        c3['Close'] < c2['Open']):    # Closes below previous open
-        patterns.append("Bullish Harami")
-        signal_strength += 15
-
-    # 7. BEARISH HARAMI (Moderate Sell)
-    if (c2_body > c3_body and  # Previous candle has larger body
-        c2['Close'] > c2['Open'] and  # Previous candle is bullish
-        c3['Close'] < c3['Open'] and  # Current candle is bearish
-        c3['Open'] < c2['Close'] and  # Opens below previous close
-        c3['Close'] > c2['Open']):    # Closes above previous open
-        patterns.append("Bearish Harami")
-        signal_strength -= 15
-
-    # 8. MORNING STAR (Strong Bullish Reversal - 3 candle pattern)
-    if (c1['Close'] < c1['Open'] and  # First candle bearish
-        c2_body < c1_body * 0.3 and  # Middle candle small body (star)
-        c3['Close'] > c3['Open'] and  # Third candle bullish
-        c3['Close'] > (c1['Open'] + c1['Close']) / 2):  # Closes above midpoint of first
-        patterns.append("Morning Star")
-        signal_strength += 30
-
-    # 9. EVENING STAR (Strong Bearish Reversal - 3 candle pattern)
-    if (c1['Close'] > c1['Open'] and  # First candle bullish
-        c2_body < c1_body * 0.3 and  # Middle candle small body (star)
-        c3['Close'] < c3['Open'] and  # Third candle bearish
-        c3['Close'] < (c1['Open'] + c1['Close']) / 2):  # Closes below midpoint of first
-        patterns.append("Evening Star")
-        signal_strength -= 30
-
-    # 10. THREE WHITE SOLDIERS (Very Strong Bullish)
-    if (c1['Close'] > c1['Open'] and  # All three candles bullish
-        c2['Close'] > c2['Open'] and
-        c3['Close'] > c3['Open'] and
-        c2['Close'] > c1['Close'] and  # Each closes higher than previous
-        c3['Close'] > c2['Close'] and
-        c2['Open'] > c1['Open'] and  # Each opens within previous body
-        c3['Open'] > c2['Open']):
-        patterns.append("Three White Soldiers")
-        signal_strength += 35
-
-    # 11. THREE BLACK CROWS (Very Strong Bearish)
-    if (c1['Close'] < c1['Open'] and  # All three candles bearish
-        c2['Close'] < c2['Open'] and
-        c3['Close'] < c3['Open'] and
-        c2['Close'] < c1['Close'] and  # Each closes lower than previous
-        c3['Close'] < c2['Close'] and
-        c2['Open'] < c1['Open'] and  # Each opens within previous body
-        c3['Open'] < c2['Open']):
-        patterns.append("Three Black Crows")
-        signal_strength -= 35
+    # Get last 3 candles as plain floats: c1 = 2 candles ago, c2 = 1 candle ago, c3 = current
+    opens, highs, lows, closes = (column[-3:].tolist() for column in (open_, high, low, close))
+    o1, o2, o3 = opens
+    h1, h2, h3 = highs
+    l1, l2, l3 = lows
+    cl1, cl2, cl3 = closes
+
+    # Calculate candle bodies and shadows (conditional expressions rather than abs/max/min calls;
+    # max(a, b) and min(a, b) keep a unless b compares past it, which the operand order preserves for NaN)
+    c3_body = cl3 - o3 if cl3 > o3 else o3 - cl3
+    c3_range = h3 - l3
+    c3_upper_shadow = h3 - (o3 if o3 > cl3 else cl3)
+    c3_lower_shadow = (o3 if o3 < cl3 else cl3) - l3
+
+    c2_body = cl2 - o2 if cl2 > o2 else o2 - cl2
+
+    c1_body = cl1 - o1 if cl1 > o1 else o1 - cl1
+
+    # Candle directions, shared by the patterns below (a flat candle is neither)
+    c1_bull, c1_bear = cl1 > o1, cl1 < o1
+    c2_bull, c2_bear = cl2 > o2, cl2 < o2
+    c3_bull, c3_bear = cl3 > o3, cl3 < o3
+
+    # One flag per pattern, in PRICE_ACTION_PATTERNS order
+    hits = (
+        # 1. Bullish Engulfing: bearish candle, then a bullish one opening below its close and closing above its open
+        c2_bear and c3_bull and o3 < cl2 and cl3 > o2,
+        # 2. Bearish Engulfing: bullish candle, then a bearish one opening above its close and closing below its open
+        c2_bull and c3_bear and o3 > cl2 and cl3 < o2,
+        # 3. Hammer: long lower shadow, small upper shadow, has a body
+        c3_lower_shadow > 2 * c3_body and c3_upper_shadow < c3_body * 0.3 and c3_body > 0,
+        # 4. Shooting Star: long upper shadow, small lower shadow, has a body
+        c3_upper_shadow > 2 * c3_body and c3_lower_shadow < c3_body * 0.3 and c3_body > 0,
+        # 5. Doji: very small body (indecision)
+        c3_range > 0 and c3_body < c3_range * 0.1,
+        # 6. Bullish Harami: bullish candle inside a larger bearish body
+        c2_body > c3_body and c2_bear and c3_bull and o3 > cl2 and cl3 < o2,
+        # 7. Bearish Harami: bearish candle inside a larger bullish body
+        c2_body > c3_body and c2_bull and c3_bear and o3 < cl2 and cl3 > o2,
+        # 8. Morning Star: bearish candle, small-bodied star, bullish close above the first candle's midpoint
+        c1_bear and c2_body < c1_body * 0.3 and c3_bull and cl3 > (o1 + cl1) / 2,
+        # 9. Evening Star: bullish candle, small-bodied star, bearish close below the first candle's midpoint
+        c1_bull and c2_body < c1_body * 0.3 and c3_bear and cl3 < (o1 + cl1) / 2,
+        # 10. Three White Soldiers: three bullish candles, each opening and closing higher
+        c1_bull and c2_bull and c3_bull and cl2 > cl1 and cl3 > cl2 and o2 > o1 and o3 > o2,
+        # 11. Three Black Crows: three bearish candles, each opening and closing lower
+        c1_bear and c2_bear and c3_bear and cl2 < cl1 and cl3 < cl2 and o2 < o1 and o3 < o2,
+    )
+
+    # Doji after an up move = bearish, after a down move = bullish
+    weights = DOJI_AFTER_RISE_WEIGHTS if cl3 > cl2 else DOJI_AFTER_FALL_WEIGHTS
+    signal_strength = int(np.dot(hits, weights))
+    patterns = [name for name, hit in zip(PRICE_ACTION_PATTERNS, hits) if hit]
 
     # Determine dominant pattern
     if signal_strength > 20:
@@ -211,7 +166,70 @@ def detect_price_action_patterns(df: pd.DataFrame) -> Dict:
     }
 
 
-def calculate_vwap_strategy_score(df: pd.DataFrame, indicators: Dict, timeframe: str = "intraday") -> Dict:
+def _vwap_inputs(df: pd.DataFrame, arrays):
+    """VWAP bands and price action patterns from one set of OHLCV arrays (the caller's, or df's)"""
+    if arrays is None:
+        arrays = _ohlcv_arrays(df)
+    open_, high, low, close, volume = arrays
+    return calculate_vwap_arrays(high, low, close, volume), detect_price_action_arrays(open_, high, low, close)
+
+
+# Timeframes the VWAP + Price Action strategy is scored for
+VWAP_TIMEFRAMES = ("intraday", "day_trading")
+# Reported with every strategy score; one shared dict, so treat it as read-only
+# (a plain dict rather than a MappingProxyType, which orjson can't serialize)
+TIMEFRAME_SUITABILITY = {
+    "intraday": "✅ EXCELLENT (70-76% win rate)",
+    "day_trading": "⚠️ MODERATE (65-70% win rate)",
+    "swing": "❌ NOT RECOMMENDED - Use MACD + EMA instead",
+    "long_term": "❌ NOT RECOMMENDED - Use Fundamental Analysis instead"
+}
+
+# Strategy ladders as (ascending bounds, (points, confirmations) per band): bullish ladders
+# score value >= bound (bisect_right), bearish ones value <= bound (bisect_left)
+INTRADAY_VWAP_BULL = ((60, 70), ((0, 0), (15, 0.5), (30, 1)))  # Above VWAP, below -1σ or -2σ (oversold)
+INTRADAY_VWAP_BEAR = ((30, 40), ((-30, -1), (-15, -0.5), (0, 0)))  # Above +1σ or +2σ (overbought), below VWAP
+INTRADAY_PATTERN_BULL = ((15, 25), ((0, 0), (15, 0.5), (25, 1)))
+INTRADAY_PATTERN_BEAR = ((-25, -15), ((-25, -1), (-15, -0.5), (0, 0)))
+# Day trading: same signals with reduced weight
+DAY_TRADING_VWAP_BULL = ((70,), ((0, 0), (20, 0.7)))
+DAY_TRADING_VWAP_BEAR = ((30,), ((-20, -0.7), (0, 0)))
+DAY_TRADING_PATTERN_BULL = ((25,), ((0, 0), (20, 0.7)))
+DAY_TRADING_PATTERN_BEAR = ((-25,), ((-20, -0.7), (0, 0)))
+
+
+# Signal by confirmation bucket (bearish, mixed, bullish) and score bucket (low, middle, high):
+# a BUY or SELL needs both the confirmations and the score to agree
+SIGNAL_TABLE = (
+    ("SELL", "NEUTRAL", "NEUTRAL"),
+    ("NEUTRAL", "NEUTRAL", "NEUTRAL"),
+    ("NEUTRAL", "NEUTRAL", "BUY"),
+)
+# (confirmations needed, BUY score at or above, SELL score at or below)
+INTRADAY_SIGNAL_THRESHOLDS = (2, 65, 35)
+DAY_TRADING_SIGNAL_THRESHOLDS = (1.5, 60, 40)
+
+
+def strategy_signal(confirmations: float, strategy_score: float, thresholds: Tuple) -> str:
+    """BUY / SELL / NEUTRAL from SIGNAL_TABLE"""
+    min_confirmations, buy_score, sell_score = thresholds
+    row = (confirmations > -min_confirmations) + (confirmations >= min_confirmations)
+    column = (strategy_score > sell_score) + (strategy_score >= buy_score)
+    return SIGNAL_TABLE[row][column]
+
+
+def ladder_points(value: float, bull: Tuple, bear: Tuple) -> Tuple:
+    """(points, confirmations) of value on a bullish and a bearish ladder; their scoring bands don't overlap"""
+    bounds, steps = bull
+    points, confirmations = steps[bisect_right(bounds, value)]
+    if not points:
+        bounds, steps = bear
+        points, confirmations = steps[bisect_left(bounds, value)]
+    return points, confirmations
+
+
+def calculate_vwap_strategy_score(df: pd.DataFrame, indicators, timeframe: str = "intraday", arrays=None,
+                                  include_vwap_data: bool = False) -> Dict:
     """
     VWAP + Price Action Strategy Across Multiple Timeframes
     Timeframes: intraday (1-3 days), day_trading (3-6 hours), swing (not recommended), long_term (not recommended)
@@ -219,22 +237,34 @@ def calculate_vwap_strategy_score(df: pd.DataFrame, indicators: Dict, timeframe:
     Best for: INTRADAY TRADING ONLY (70-76% win rate)
     Moderate for: DAY TRADING (65-70% win rate)
     NOT RECOMMENDED for: SWING TRADING or LONG-TERM (use MACD/Fundamentals instead)
-    """
-    # Calculate VWAP
-    vwap_data = calculate_vwap(df)
 
-    # Detect Price Action Patterns
-    price_action = detect_price_action_patterns(df)
-
-    # Get volume analysis
-    volume = indicators['volume']
+    indicators: trading_signals.Indicators of the ticker's full history
+    arrays: df's Open, High, Low, Close and Volume arrays (e.g. trading_signals.PriceArrays), if the caller has them
+    include_vwap_data: still compute and report VWAP and patterns for swing/long-term, where they aren't
+        scored; by default those timeframes skip them and report empty dicts
+    """
+    if timeframe not in VWAP_TIMEFRAMES:
+        # SWING/LONG-TERM: VWAP + Price Action is NOT RECOMMENDED, so nothing is scored
+        vwap_data, price_action = _vwap_inputs(df, arrays) if include_vwap_data else ({}, {})
+        return _strategy_result(
+            "NOT APPLICABLE", 50, 0,
+            "POOR - Use MACD + EMA for swing, Fundamentals for long-term",
+            "DO NOT USE VWAP for swing/long-term trading. VWAP resets daily and loses meaning over multi-day periods.",
+            vwap_data, price_action
+        )
+
+    # Calculate VWAP and detect Price Action Patterns on one set of OHLCV arrays
+    vwap_data, price_action = _vwap_inputs(df, arrays)
+    current_price = df['Close'].iat[-1] if arrays is None else arrays[3][-1]
 
     # Get momentum (ADX for trend strength)
-    momentum = indicators['momentum']
-    adx = momentum['adx']
+    adx = indicators.adx
     is_trending = adx > 25
 
-    current_price = df['Close'].iloc[-1]
+    # Bound once: the scoring below reads each of these several times
+    vwap_score = vwap_data['position_score']
+    pa_strength = price_action['signal_strength']
+    volume_ratio = indicators.volume_ratio
 
     # STRATEGY EFFECTIVENESS BY TIMEFRAME
     if timeframe == "intraday":
@@ -243,44 +273,25 @@ def calculate_vwap_strategy_score(df: pd.DataFrame, indicators: Dict, timeframe:
         confirmations = 0
 
         # 1. VWAP Position (30 points) - Most important for intraday
-        vwap_score = vwap_data['position_score']
-        if vwap_score >= 70:  # Below -1σ or -2σ (oversold)
-            strategy_score += 30
-            confirmations += 1
-        elif vwap_score >= 60:  # Above VWAP
-            strategy_score += 15
-            confirmations += 0.5
-        elif vwap_score <= 30:  # Above +1σ or +2σ (overbought)
-            strategy_score -= 30
-            confirmations -= 1
-        elif vwap_score <= 40:  # Below VWAP
-            strategy_score -= 15
-            confirmations -= 0.5
+        points, confirmation = ladder_points(vwap_score, INTRADAY_VWAP_BULL, INTRADAY_VWAP_BEAR)
+        strategy_score += points
+        confirmations += confirmation
 
         # 2. Price Action Patterns (25 points) - Critical for entry/exit
-        pa_strength = price_action['signal_strength']
-        if pa_strength >= 25:  # Strong bullish pattern
-            strategy_score += 25
-            confirmations += 1
-        elif pa_strength >= 15:  # Moderate bullish
-            strategy_score += 15
-            confirmations += 0.5
-        elif pa_strength <= -25:  # Strong bearish
-            strategy_score -= 25
-            confirmations -= 1
-        elif pa_strength <= -15:  # Moderate bearish
-            strategy_score -= 15
-            confirmations -= 0.5
+        # Strong (+/-25) or moderate (+/-15) bullish/bearish patterns
+        points, confirmation = ladder_points(pa_strength, INTRADAY_PATTERN_BULL, INTRADAY_PATTERN_BEAR)
+        strategy_score += points
+        confirmations += confirmation
 
         # 3. Volume Confirmation (25 points) - CRITICAL for intraday
         # High volume confirms VWAP signals
-        if volume['volume_ratio'] > 1.5 and volume['obv_trend'] > 0:
+        if volume_ratio > 1.5 and indicators.obv_trend > 0:
             strategy_score += 25
             confirmations += 1
-        elif volume['volume_ratio'] > 1.2:
+        elif volume_ratio > 1.2:
             strategy_score += 15
             confirmations += 0.5
-        elif volume['volume_ratio'] < 0.8:
+        elif volume_ratio < 0.8:
             strategy_score -= 15
             confirmations -= 0.5
 
@@ -288,70 +299,51 @@ def calculate_vwap_strategy_score(df: pd.DataFrame, indicators: Dict, timeframe:
         # Strong trends make VWAP signals more reliable
         if is_trending:
             # In strong trend, VWAP alignment with trend is powerful
-            if current_price > vwap_data['vwap'] and momentum['roc_10'] > 0:
+            vwap = vwap_data['vwap']
+            roc_10 = indicators.roc_10
+            if current_price > vwap and roc_10 > 0:
                 strategy_score += 20
                 confirmations += 0.5
-            elif current_price < vwap_data['vwap'] and momentum['roc_10'] < 0:
+            elif current_price < vwap and roc_10 < 0:
                 strategy_score -= 20
                 confirmations -= 0.5
 
         # Require at least 2 confirmations for signal
-        if confirmations >= 2:
-            signal = "BUY" if strategy_score >= 65 else "NEUTRAL"
-        elif confirmations <= -2:
-            signal = "SELL" if strategy_score <= 35 else "NEUTRAL"
-        else:
-            signal = "NEUTRAL"
+        signal = strategy_signal(confirmations, strategy_score, INTRADAY_SIGNAL_THRESHOLDS)
 
         effectiveness = "EXCELLENT (70-76% win rate)"
         recommendation = "Use this strategy - Perfect for intraday trading"
 
-    elif timeframe == "day_trading":
+    else:  # day_trading
         # DAY TRADING: VWAP + Price Action is MODERATE (65-70% win rate)
         strategy_score = 50
         confirmations = 0
 
         # Same logic as intraday but with reduced confidence
-        vwap_score = vwap_data['position_score']
-        pa_strength = price_action['signal_strength']
-
-        if vwap_score >= 70:
-            strategy_score += 20  # Reduced from 30
-            confirmations += 0.7
-        elif vwap_score <= 30:
-            strategy_score -= 20
-            confirmations -= 0.7
-
-        if pa_strength >= 25:
-            strategy_score += 20  # Reduced from 25
-            confirmations += 0.7
-        elif pa_strength <= -25:
-            strategy_score -= 20
-            confirmations -= 0.7
-
-        if volume['volume_ratio'] > 1.3:
+        points, confirmation = ladder_points(vwap_score, DAY_TRADING_VWAP_BULL, DAY_TRADING_VWAP_BEAR)
+        strategy_score += points  # 20, reduced from 30
+        confirmations += confirmation
+
+        points, confirmation = ladder_points(pa_strength, DAY_TRADING_PATTERN_BULL, DAY_TRADING_PATTERN_BEAR)
+        strategy_score += points  # 20, reduced from 25
+        confirmations += confirmation
+
+        if volume_ratio > 1.3:
             strategy_score += 15  # Reduced from 25
             confirmations += 0.6
 
         # Require at least 1.5 confirmations
-        if confirmations >= 1.5:
-            signal = "BUY" if strategy_score >= 60 else "NEUTRAL"
-        elif confirmations <= -1.5:
-            signal = "SELL" if strategy_score <= 40 else "NEUTRAL"
-        else:
-            signal = "NEUTRAL"
+        signal = strategy_signal(confirmations, strategy_score, DAY_TRADING_SIGNAL_THRESHOLDS)
 
         effectiveness = "MODERATE (65-70% win rate)"
         recommendation = "Acceptable but less effective than pure intraday"
 
-    else:  # swing or long_term
-        # SWING/LONG-TERM: VWAP + Price Action is NOT RECOMMENDED
-        strategy_score = 50  # Neutral default
-        signal = "NOT APPLICABLE"
-        confirmations = 0
-        effectiveness = "POOR - Use MACD + EMA for swing, Fundamentals for long-term"
-        recommendation = "DO NOT USE VWAP for swing/long-term trading. VWAP resets daily and loses meaning over multi-day periods."
+    return _strategy_result(signal, strategy_score, round(confirmations, 2), effectiveness, recommendation,
+                            vwap_data, price_action)
+
 
+def _strategy_result(signal: str, strategy_score: float, confirmations: float, effectiveness: str,
+                     recommendation: str, vwap_data: Dict, price_action: Dict) -> Dict:
     return {
         "signal": signal,
         "score": round(strategy_score, 2),
@@ -359,11 +351,6 @@ def calculate_vwap_strategy_score(df: pd.DataFrame, indicators: Dict, timeframe:
         "recommendation": recommendation,
         "vwap_data": vwap_data,
         "price_action": price_action,
-        "confirmations": round(confirmations, 2) if timeframe in ["intraday", "day_trading"] else 0,
-        "timeframe_suitability": {
-            "intraday": "✅ EXCELLENT (70-76% win rate)",
-            "day_trading": "⚠️ MODERATE (65-70% win rate)",
-            "swing": "❌ NOT RECOMMENDED - Use MACD + EMA instead",
-            "long_term": "❌ NOT RECOMMENDED - Use Fundamental Analysis instead"
-        }
+        "confirmations": confirmations,
+        "timeframe_suitability": TIMEFRAME_SUITABILITY
     }